@@ -20,13 +20,16 @@ from collections import OrderedDict
 
 from qiskit.providers import BaseProvider  # type: ignore[attr-defined]
 from qiskit.validation.exceptions import ModelValidationError
-from qiskit.providers.models import (QasmBackendConfiguration,
+from qiskit.providers.models import (BackendConfiguration, QasmBackendConfiguration,
                                      PulseBackendConfiguration)
 
 from .api.clients import AccountClient
 from .ibmqbackend import IBMQBackend, IBMQSimulator
 from .credentials import Credentials
 from .ibmqbackendservice import IBMQBackendService
+from .utils.configuration_cache import BackendConfigurationCache
+from .utils.properties_cache import BackendPropertiesCache
+from .utils.result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +73,15 @@ class AccountProvider(BaseProvider):
         if an error occurs during backend discovery. Also note that
         this feature is only available in interactive sessions, such as
         in Jupyter Notebook and the Python interpreter.
+
+    The backend properties are cached in the ``properties_cache`` attribute,
+    shared by the backends of the provider. Its ``ttl`` attribute controls how
+    long the latest properties are used before they are revalidated, and its
+    :meth:`~qiskit.providers.ibmq.utils.properties_cache.BackendPropertiesCache.stats`
+    method reports how often the cache is used::
+
+        provider.properties_cache.ttl = 60
+        provider.properties_cache.stats()
     """
 
     def __init__(self, credentials: Credentials, access_token: str) -> None:
@@ -83,12 +95,22 @@ class AccountProvider(BaseProvider):
 
         self.credentials = credentials
         # set the client.
+        result_cache_kwargs = credentials.result_cache_parameters()
         self._api = AccountClient(access_token,
                                   credentials.url,
                                   credentials.websockets_url,
                                   use_websockets=(not credentials.proxies),
+                                  result_cache=(ResultCache(**result_cache_kwargs)
+                                                if result_cache_kwargs is not None else None),
                                   **credentials.connection_parameters())
 
+        configuration_cache_kwargs = credentials.configuration_cache_parameters()
+        self._configuration_cache = (BackendConfigurationCache(**configuration_cache_kwargs)
+                                     if configuration_cache_kwargs is not None else None)
+
+        # Cache of backend properties, shared by the backends.
+        self.properties_cache = BackendPropertiesCache(self._api)
+
         # Initialize the internal list of backends.
         self._backends = self._discover_remote_backends()
         self.backends = IBMQBackendService(self)  # type: ignore[assignment]
@@ -112,7 +134,61 @@ class AccountProvider(BaseProvider):
             A dict of the remote backend instances, keyed by backend name.
         """
         ret = OrderedDict()  # type: ignore[var-annotated]
-        configs_list = self._api.list_backends(timeout=timeout)
+        for config in self._get_backend_configurations(timeout=timeout):
+            backend_cls = IBMQSimulator if config.simulator else IBMQBackend
+            ret[config.backend_name] = backend_cls(
+                configuration=config,
+                provider=self,
+                credentials=self.credentials,
+                api=self._api,
+                properties_cache=self.properties_cache)
+
+        return ret
+
+    def _get_backend_configurations(
+            self,
+            timeout: Optional[float] = None
+    ) -> List[BackendConfiguration]:
+        """Return the configurations of the remote backends available for this provider.
+
+        If a backend configuration cache is used, the server is asked for the
+        configurations only if they changed since they were cached, and the
+        cached configurations are used otherwise, without being validated again.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the configurations.
+
+        Returns:
+            The backend configurations.
+        """
+        if not self._configuration_cache:
+            return self._parse_backend_configurations(self._api.list_backends(timeout=timeout))
+
+        cached = self._configuration_cache.load(self.credentials.url)
+        response = self._api.list_backends_if_modified(
+            etag=cached['etag'] if cached else None, timeout=timeout)
+        if cached and (response['backends'] is None or response['digest'] == cached['digest']):
+            logger.debug('Using the cached backend configurations.')
+            return cached['configurations']
+
+        configurations = self._parse_backend_configurations(response['backends'])
+        self._configuration_cache.save(self.credentials.url, configurations,
+                                       response['etag'], response['digest'])
+        return configurations
+
+    @staticmethod
+    def _parse_backend_configurations(
+            configs_list: List[Dict[str, Any]]
+    ) -> List[BackendConfiguration]:
+        """Convert the backend configurations returned by the server.
+
+        Args:
+            configs_list: Backend configurations in the format returned by the server.
+
+        Returns:
+            The valid backend configurations.
+        """
+        configurations = []
         for raw_config in configs_list:
             # Make sure the raw_config is of proper type
             if not isinstance(raw_config, dict):
@@ -125,12 +201,7 @@ class AccountProvider(BaseProvider):
                     config = PulseBackendConfiguration.from_dict(raw_config)
                 else:
                     config = QasmBackendConfiguration.from_dict(raw_config)
-                backend_cls = IBMQSimulator if config.simulator else IBMQBackend
-                ret[config.backend_name] = backend_cls(
-                    configuration=config,
-                    provider=self,
-                    credentials=self.credentials,
-                    api=self._api)
+                configurations.append(config)
             except ModelValidationError as ex:
                 logger.warning(
                     'Remote backend "%s" could not be instantiated due to an '
@@ -139,7 +210,7 @@ class AccountProvider(BaseProvider):
                                    raw_config.get('name', 'unknown')),
                     ex)
 
-        return ret
+        return configurations
 
     def __eq__(  # type: ignore[overide]
             self,
@@ -18,13 +18,17 @@ import asyncio
 import logging
 import time
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, IO
+from concurrent import futures
 # Disabled unused-import because datetime is used only for type hints.
 from datetime import datetime  # pylint: disable=unused-import
 
 from qiskit.providers.ibmq.apiconstants import (API_JOB_FINAL_STATES, ApiJobStatus,
                                                 ApiJobShareLevel)
 from qiskit.providers.ibmq.utils.utils import RefreshQueue
+from qiskit.providers.ibmq.utils import json_encoder
+from qiskit.providers.ibmq.utils.json_decoder import load_lazy, LazyJSONArray
+from qiskit.providers.ibmq.utils.result_cache import ResultCache
 
 from ..exceptions import (RequestsApiError, WebsocketError,
                           WebsocketTimeoutError, UserTimeoutExceededError)
@@ -40,12 +44,16 @@ logger = logging.getLogger(__name__)
 class AccountClient(BaseClient):
     """Client for accessing an individual IBM Quantum Experience account."""
 
+    _executor = futures.ThreadPoolExecutor()
+    """Threads used for serializing ``Qobj`` while the submit requests are in flight."""
+
     def __init__(
             self,
             access_token: str,
             project_url: str,
             websockets_url: str,
             use_websockets: bool,
+            result_cache: Optional[ResultCache] = None,
             **request_kwargs: Any
     ) -> None:
         """AccountClient constructor.
@@ -55,12 +63,33 @@ class AccountClient(BaseClient):
             project_url: IBM Quantum Experience URL for a specific hub/group/project.
             websockets_url: URL for the websockets server.
             use_websockets: Whether to use webscokets.
+            result_cache: Local store that job results are read from, if
+                present, and written to after they are retrieved.
             **request_kwargs: Arguments for the request ``Session``.
         """
         self.client_api = Api(RetrySession(project_url, access_token,
                                            **request_kwargs))
         self.client_ws = WebsocketClient(websockets_url, access_token)
         self._use_websockets = use_websockets
+        self.result_cache = result_cache
+
+    # Session-related public functions.
+
+    def ensure_pool_size(self, pool_maxsize: int) -> None:
+        """Make sure the HTTP connection pools can hold at least `pool_maxsize` connections.
+
+        Args:
+            pool_maxsize: Minimum number of connections for each per-host pool.
+        """
+        self.client_api.session.ensure_pool_size(pool_maxsize)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Return statistics about HTTP connection reuse.
+
+        Returns:
+            Connection pool statistics, as returned by ``RetrySession.pool_stats()``.
+        """
+        return self.client_api.session.pool_stats()
 
     # Backend-related public functions.
 
@@ -75,6 +104,24 @@ class AccountClient(BaseClient):
         """
         return self.client_api.backends(timeout=timeout)
 
+    def list_backends_if_modified(
+            self,
+            etag: Optional[str] = None,
+            timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Return backends available for this provider, unless they did not change.
+
+        Args:
+            etag: Entity tag of a previous response.
+            timeout: Number of seconds to wait for the request.
+
+        Returns:
+            A dictionary with the backends, or ``None`` if they did not change,
+            and the entity tag and digest of the response, as returned by
+            ``Api.backends_if_modified()``.
+        """
+        return self.client_api.backends_if_modified(etag=etag, timeout=timeout)
+
     def backend_status(self, backend_name: str) -> Dict[str, Any]:
         """Return the status of the backend.
 
@@ -157,16 +204,25 @@ class AccountClient(BaseClient):
             qobj_dict: Dict[str, Any],
             job_name: Optional[str] = None,
             job_share_level: Optional[ApiJobShareLevel] = None,
-            job_tags: Optional[List[str]] = None
+            job_tags: Optional[List[str]] = None,
+            created_callback: Optional[Callable[[], None]] = None
     ) -> Dict[str, Any]:
         """Submit a ``Qobj`` to the backend.
 
+        The ``Qobj`` is serialized in a separate thread while the remote job
+        is being created, and the upload URL returned along with the remote
+        job is used when available, saving a round trip.
+
         Args:
             backend_name: The name of the backend.
             qobj_dict: The ``Qobj`` to be executed, as a dictionary.
             job_name: Custom name to be assigned to the job.
             job_share_level: Level the job should be shared at.
             job_tags: Tags to be assigned to the job.
+            created_callback: Function called, with no arguments, once the
+                remote job has been created and before the ``Qobj`` is
+                uploaded. It can be used by callers that only need to
+                synchronize the job creation.
 
         Returns:
             Job data.
@@ -174,20 +230,28 @@ class AccountClient(BaseClient):
         # Check for the job share level.
         _job_share_level = job_share_level.value if job_share_level else None
 
+        # Serialize the Qobj while the remote job is being created.
+        qobj_future = self._executor.submit(json_encoder.dump_to_spool, qobj_dict)
+
         # Create a remote job instance on the server.
         job_info = self.client_api.create_remote_job(
             backend_name,
             job_name=job_name,
             job_share_level=_job_share_level,
             job_tags=job_tags)
+        if created_callback:
+            created_callback()
 
-        # Get the upload URL.
+        # Get the upload URL, unless it was returned with the remote job.
         job_id = job_info['id']
         job_api = self.client_api.job(job_id)
-        upload_url = job_api.upload_url()['url']
+        upload_url = job_info.get('objectStorageInfo', {}).get('uploadUrl')
+        if not upload_url:
+            upload_url = job_api.upload_url()['url']
 
         # Upload the Qobj to object storage.
-        _ = job_api.put_object_storage(upload_url, qobj_dict)
+        with qobj_future.result() as qobj_data:
+            _ = job_api.put_object_storage(upload_url, qobj_data)
 
         # Notify the API via the callback.
         response = job_api.callback_upload()
@@ -229,6 +293,9 @@ class AccountClient(BaseClient):
     def job_result(self, job_id: str, use_object_storage: bool) -> Dict:
         """Retrieve and return the job result.
 
+        If a result cache is used, the result is read from it when present,
+        and stored in it after it is retrieved from the server.
+
         Args:
             job_id: The ID of the job.
             use_object_storage: ``True`` if object storage should be used.
@@ -239,18 +306,34 @@ class AccountClient(BaseClient):
         Raises:
             ApiIBMQProtocolError: If unexpected data is received from the server.
         """
+        if self.result_cache:
+            result_file = self.result_cache.get(job_id)
+            if result_file:
+                logger.debug('Using the cached result of job %s.', job_id)
+                return self._load_result(result_file)
+
         if use_object_storage:
             return self._job_result_object_storage(job_id)
 
         try:
-            return self.job_get(job_id)['qObjectResult']
+            result_response = self.job_get(job_id)['qObjectResult']
         except KeyError as err:
             raise ApiIBMQProtocolError(
                 'Unexpected return value received from the server: {}'.format(str(err))) from err
 
+        if self.result_cache:
+            with json_encoder.dump_to_spool(result_response) as result_file:
+                self.result_cache.put(job_id, result_file)
+        return result_response
+
     def _job_result_object_storage(self, job_id: str) -> Dict:
         """Retrieve and return the job result using object storage.
 
+        The result is downloaded into a spool file, and its experiment
+        results are returned as a
+        :class:`~qiskit.providers.ibmq.utils.json_decoder.LazyJSONArray`
+        that decodes each of them when it is accessed.
+
         Args:
             job_id: The ID of the job.
 
@@ -262,8 +345,12 @@ class AccountClient(BaseClient):
         # Get the download URL.
         download_url = job_api.result_url()['url']
 
-        # Download the result from object storage.
-        result_response = job_api.get_object_storage(download_url)
+        # Download the result from object storage, and decode all but the
+        # experiment results.
+        result_file = job_api.download_object_storage(download_url)
+        if self.result_cache:
+            self.result_cache.put(job_id, result_file)
+        result_response = self._load_result(result_file)
 
         # Notify the API via the callback
         try:
@@ -273,6 +360,30 @@ class AccountClient(BaseClient):
                            '%s', ex)
         return result_response
 
+    @staticmethod
+    def _load_result(result_file: IO[bytes]) -> Dict:
+        """Decode a job result from a file, leaving its experiment results undecoded.
+
+        Args:
+            result_file: Binary file object with the JSON result. It is closed
+                unless the experiment results are decoded lazily from it.
+
+        Returns:
+            Job result.
+
+        Raises:
+            ValueError: If the result is not a valid JSON object.
+        """
+        try:
+            result_response = load_lazy(result_file, lazy_keys=('results',),
+                                        summary_keys=('success', 'status'))
+        except ValueError:
+            result_file.close()
+            raise
+        if not isinstance(result_response.get('results', None), LazyJSONArray):
+            result_file.close()
+        return result_response
+
     def job_get(
             self,
             job_id: str
@@ -16,10 +16,9 @@
 
 import logging
 import pprint
-import json
 from json.decoder import JSONDecodeError
 
-from typing import Dict, Any
+from typing import Dict, Any, Union, IO
 from marshmallow.exceptions import ValidationError
 
 from qiskit.providers.ibmq.utils import json_encoder
@@ -161,19 +160,36 @@ class Job(RestAdapterBase):
         url = self.get_url('upload_url')
         return self.session.get(url).json()
 
-    def put_object_storage(self, url: str, qobj_dict: Dict[str, Any]) -> str:
+    def put_object_storage(
+            self,
+            url: str,
+            qobj: Union[Dict[str, Any], IO[bytes]],
+            compress: bool = False
+    ) -> str:
         """Upload a ``Qobj`` via object storage.
 
+        The ``Qobj`` is serialized in chunks into a spool file, which is then
+        streamed to object storage, so the full JSON document is never held
+        in memory for large ``Qobj``.
+
         Args:
             url: Object storage URL.
-            qobj_dict: The ``Qobj`` to be uploaded, in dictionary form.
+            qobj: The ``Qobj`` to be uploaded, in dictionary form or as a file
+                object returned by
+                :func:`~qiskit.providers.ibmq.utils.json_encoder.dump_to_spool`.
+            compress: Whether the body is gzipped. If ``qobj`` is a dictionary,
+                it is compressed before being uploaded.
 
         Returns:
             Text response, which is empty if the request was successful.
         """
-        data = json.dumps(qobj_dict, cls=json_encoder.IQXJsonEconder)
+        if isinstance(qobj, dict):
+            with json_encoder.dump_to_spool(qobj, compress=compress) as data:
+                return self.put_object_storage(url, data, compress=compress)
+
+        headers = {'Content-Encoding': 'gzip'} if compress else None
         logger.debug('Uploading Qobj to object storage.')
-        response = self.session.put(url, data=data, bare=True)
+        response = self.session.put(url, data=qobj, headers=headers, bare=True)
         return response.text
 
     def get_object_storage(self, url: str) -> Dict[str, Any]:
@@ -188,3 +204,24 @@ class Job(RestAdapterBase):
         logger.debug('Downloading Qobj from object storage.')
         response = self.session.get(url, bare=True).json()
         return response
+
+    def download_object_storage(self, url: str) -> IO[bytes]:
+        """Download via object storage into a file object.
+
+        The response body is streamed into a spool file, kept in memory for
+        small responses and written to a temporary file for large ones.
+
+        Args:
+            url: Object storage URL.
+
+        Returns:
+            A binary file object with the response body, positioned at the start.
+            The caller is responsible for closing it.
+        """
+        logger.debug('Downloading from object storage.')
+        response = self.session.get(url, bare=True, stream=True)
+        try:
+            return json_encoder.write_to_spool(
+                response.iter_content(chunk_size=json_encoder.CHUNK_SIZE))
+        finally:
+            response.close()
@@ -14,6 +14,7 @@
 
 """Root REST adapter."""
 
+import hashlib
 import json
 import logging
 from typing import Dict, List, Optional, Any
@@ -73,6 +74,35 @@ class Api(RestAdapterBase):
         url = self.get_url('backends')
         return self.session.get(url, timeout=timeout).json()
 
+    def backends_if_modified(
+            self,
+            etag: Optional[str] = None,
+            timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Return a list of backends, unless it did not change.
+
+        Args:
+            etag: Entity tag of a previous response. If the server reports
+                that the list did not change since, it is not downloaded.
+            timeout: Number of seconds to wait for the request.
+
+        Returns:
+            A dictionary with the following keys:
+
+                * ``backends``: JSON response, or ``None`` if it did not change.
+                * ``etag``: entity tag of the response, if any.
+                * ``digest``: SHA-256 digest of the response body, or ``None``
+                  if it did not change.
+        """
+        url = self.get_url('backends')
+        headers = {'If-None-Match': etag} if etag else {}
+        response = self.session.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304:
+            return {'backends': None, 'etag': etag, 'digest': None}
+        return {'backends': response.json(),
+                'etag': response.headers.get('ETag', None),
+                'digest': hashlib.sha256(response.content).hexdigest()}
+
     def hubs(self) -> List[Dict[str, Any]]:
         """Return the list of hub/group/project sets available to the user.
 
@@ -32,6 +32,10 @@ STATUS_FORCELIST = (
     503,  # Service Unavailable
     504,  # Gateway Timeout
 )
+DEFAULT_POOL_CONNECTIONS = 10
+"""Default number of per-host connection pools to cache."""
+DEFAULT_POOL_MAXSIZE = 10
+"""Default maximum number of connections to keep in each per-host pool."""
 CLIENT_APPLICATION = 'ibmqprovider/' + ibmq_provider_version
 CUSTOM_HEADER_ENV_VAR = 'QE_CUSTOM_CLIENT_APP_HEADER'
 logger = logging.getLogger(__name__)
@@ -90,7 +94,10 @@ class RetrySession(Session):
             verify: bool = True,
             proxies: Optional[Dict[str, str]] = None,
             auth: Optional[AuthBase] = None,
-            timeout: Tuple[float, Union[float, None]] = (5.0, None)
+            timeout: Tuple[float, Union[float, None]] = (5.0, None),
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            pool_block: bool = False
     ) -> None:
         """RetrySession constructor.
 
@@ -105,6 +112,12 @@ class RetrySession(Session):
             auth: Authentication handler.
             timeout: Timeout for the requests, in the form of (connection_timeout,
                 total_timeout).
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections to keep in each
+                per-host pool, which is also the maximum number of
+                connections that can be reused concurrently for a host.
+            pool_block: If ``True``, block when no free connection is available
+                in a per-host pool, instead of opening a new, non-reusable one.
         """
         super().__init__()
 
@@ -112,6 +125,11 @@ class RetrySession(Session):
         self._access_token = access_token
         self.access_token = access_token
 
+        self._retry = None  # type: Optional[Retry]
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+
         self._initialize_retry(retries_total, retries_connect, backoff_factor)
         self._initialize_session_parameters(verify, proxies or {}, auth)
         self._timeout = timeout
@@ -147,17 +165,77 @@ class RetrySession(Session):
             retries_connect: Number of connect retries for the requests.
             backoff_factor: Backoff factor between retry attempts.
         """
-        retry = PostForcelistRetry(
+        self._retry = PostForcelistRetry(
             total=retries_total,
             connect=retries_connect,
             backoff_factor=backoff_factor,
             status_forcelist=STATUS_FORCELIST,
         )
-
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        self._mount_adapters()
+
+    def _mount_adapters(self) -> None:
+        """Mount the HTTP adapters, using the retry policy and pool settings."""
+        retry_adapter = HTTPAdapter(max_retries=self._retry,
+                                    pool_connections=self._pool_connections,
+                                    pool_maxsize=self._pool_maxsize,
+                                    pool_block=self._pool_block)
         self.mount('http://', retry_adapter)
         self.mount('https://', retry_adapter)
 
+    def ensure_pool_size(self, pool_maxsize: int) -> None:
+        """Grow the per-host connection pools so they hold at least `pool_maxsize` connections.
+
+        This is used when the session is shared by several threads (for example,
+        the ones used by the job manager to submit jobs), so connections can be
+        reused by all of them instead of being discarded when the pool is full.
+        The pools are never shrunk.
+
+        Args:
+            pool_maxsize: Minimum number of connections for each per-host pool.
+        """
+        if pool_maxsize <= self._pool_maxsize:
+            return
+
+        logger.debug('Growing the connection pools from %s to %s connections.',
+                     self._pool_maxsize, pool_maxsize)
+        self._pool_maxsize = pool_maxsize
+        for adapter in set(self.adapters.values()):
+            adapter.close()
+        self._mount_adapters()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Return statistics about connection reuse in the per-host pools.
+
+        Note:
+            The statistics only cover the pools that are currently cached by
+            the session adapters.
+
+        Returns:
+            A dictionary with the following keys:
+
+                * ``requests``: Number of requests made through the pools.
+                * ``hits``: Number of requests that reused an existing connection.
+                * ``misses``: Number of requests that required a new connection.
+                * ``pools``: Number of per-host pools currently cached.
+        """
+        stats = {'requests': 0, 'hits': 0, 'misses': 0, 'pools': 0}
+        seen_adapters = set()
+        for adapter in self.adapters.values():
+            if id(adapter) in seen_adapters or not isinstance(adapter, HTTPAdapter):
+                continue
+            seen_adapters.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats['pools'] += 1
+                stats['requests'] += pool.num_requests
+                stats['misses'] += pool.num_connections
+
+        stats['hits'] = max(stats['requests'] - stats['misses'], 0)
+        return stats
+
     def _initialize_session_parameters(
             self,
             verify: bool,
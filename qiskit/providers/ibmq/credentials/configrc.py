@@ -68,6 +68,13 @@ def read_credentials_from_qiskitrc(
         if 'proxies' in single_credentials.keys():
             single_credentials['proxies'] = literal_eval(
                 single_credentials['proxies'])
+        if 'connection_pool' in single_credentials.keys():
+            single_credentials['connection_pool'] = literal_eval(
+                single_credentials['connection_pool'])
+        for cache_key in ['result_cache', 'configuration_cache']:
+            if cache_key in single_credentials.keys():
+                single_credentials[cache_key] = literal_eval(
+                    single_credentials[cache_key])
         if 'verify' in single_credentials.keys():
             single_credentials['verify'] = bool(  # type: ignore[assignment]
                 single_credentials['verify'])
@@ -91,9 +98,14 @@ def write_qiskit_rc(
     """
     def _credentials_object_to_dict(obj: Credentials) -> Dict[str, Any]:
         """Convert a ``Credential`` object to a dictionary."""
-        return {key: getattr(obj, key) for key in
-                ['token', 'url', 'proxies', 'verify']
-                if getattr(obj, key)}
+        credentials_dict = {key: getattr(obj, key) for key in
+                            ['token', 'url', 'proxies', 'verify', 'connection_pool']
+                            if getattr(obj, key)}
+        # An empty cache configuration enables the cache with the defaults.
+        for cache_key in ['result_cache', 'configuration_cache']:
+            if getattr(obj, cache_key) is not None:
+                credentials_dict[cache_key] = getattr(obj, cache_key)
+        return credentials_dict
 
     def _section_name(credentials_: Credentials) -> str:
         """Return a string suitable for use as a unique section name."""
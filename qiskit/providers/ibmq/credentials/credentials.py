@@ -32,6 +32,15 @@ REGEX_IBMQ_HUBS = (
 TEMPLATE_IBMQ_HUBS = '{prefix}/Network/{hub}/Groups/{group}/Projects/{project}'
 """str: Template for creating an IBM Quantum Experience URL with hub/group/project information."""
 
+CONNECTION_POOL_KEYS = ('pool_connections', 'pool_maxsize', 'pool_block')
+"""tuple: Connection pool settings that are passed to the request session."""
+
+RESULT_CACHE_KEYS = ('directory', 'max_size')
+"""tuple: Result cache settings that are passed to the result cache."""
+
+CONFIGURATION_CACHE_KEYS = ('directory',)
+"""tuple: Backend configuration cache settings that are passed to the cache."""
+
 
 class Credentials:
     """IBM Quantum Experience account credentials.
@@ -50,7 +59,10 @@ class Credentials:
             group: Optional[str] = None,
             project: Optional[str] = None,
             proxies: Optional[Dict] = None,
-            verify: bool = True
+            verify: bool = True,
+            connection_pool: Optional[Dict[str, Any]] = None,
+            result_cache: Optional[Dict[str, Any]] = None,
+            configuration_cache: Optional[Dict[str, Any]] = None
     ) -> None:
         """Credentials constructor.
 
@@ -63,6 +75,20 @@ class Credentials:
             project: The project to use.
             proxies: Proxy configuration.
             verify: If ``False``, ignores SSL certificates errors.
+            connection_pool: HTTP connection pool configuration. The following
+                keys are recognized: ``pool_connections`` (number of per-host
+                pools to cache), ``pool_maxsize`` (maximum number of connections
+                kept per host), and ``pool_block`` (whether to block when no
+                connection is available for a host).
+            result_cache: Local job result cache configuration. If ``None``,
+                results are not cached. Otherwise, the following keys are
+                recognized: ``directory`` (where the results are stored,
+                ``$HOME/.qiskit/results`` by default) and ``max_size`` (maximum
+                size of the cache, in bytes).
+            configuration_cache: Local backend configuration cache configuration.
+                If ``None``, backend configurations are not cached. Otherwise,
+                the ``directory`` key (where the configurations are stored,
+                ``$HOME/.qiskit/backends`` by default) is recognized.
         """
         self.token = token
         (self.url, self.base_url,
@@ -71,6 +97,9 @@ class Credentials:
         self.websockets_url = websockets_url
         self.proxies = proxies or {}
         self.verify = verify
+        self.connection_pool = connection_pool or {}
+        self.result_cache = result_cache
+        self.configuration_cache = configuration_cache
 
         # Normalize proxy urls.
         self._prepend_protocol_if_needed()
@@ -99,7 +128,8 @@ class Credentials:
         Returns:
             A dictionary with connection-related parameters in the format
             expected by ``requests``. The following keys can be present:
-            ``proxies``, ``verify``, and ``auth``.
+            ``proxies``, ``verify``, ``auth``, ``pool_connections``,
+            ``pool_maxsize``, and ``pool_block``.
         """
         request_kwargs = {
             'verify': self.verify
@@ -115,8 +145,38 @@ class Credentials:
                     self.proxies['password_ntlm']
                 )
 
+        for key in CONNECTION_POOL_KEYS:
+            if key in self.connection_pool:
+                request_kwargs[key] = self.connection_pool[key]
+
         return request_kwargs
 
+    def result_cache_parameters(self) -> Optional[Dict[str, Any]]:
+        """Construct result cache related parameters.
+
+        Returns:
+            A dictionary with the arguments for the ``ResultCache`` constructor,
+            or ``None`` if results should not be cached. The following keys can
+            be present: ``directory`` and ``max_size``.
+        """
+        if self.result_cache is None:
+            return None
+        return {key: value for key, value in self.result_cache.items()
+                if key in RESULT_CACHE_KEYS}
+
+    def configuration_cache_parameters(self) -> Optional[Dict[str, Any]]:
+        """Construct backend configuration cache related parameters.
+
+        Returns:
+            A dictionary with the arguments for the ``BackendConfigurationCache``
+            constructor, or ``None`` if backend configurations should not be
+            cached. The following keys can be present: ``directory``.
+        """
+        if self.configuration_cache is None:
+            return None
+        return {key: value for key, value in self.configuration_cache.items()
+                if key in CONFIGURATION_CACHE_KEYS}
+
     def _prepend_protocol_if_needed(self) -> None:
         """Prepend the proxy URLs with protocol if needed."""
         if 'urls' not in self.proxies:
@@ -17,7 +17,7 @@
 import logging
 import warnings
 
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, Callable
 from datetime import datetime as python_datetime
 from marshmallow import ValidationError
 
@@ -40,6 +40,7 @@ from .exceptions import (IBMQBackendError, IBMQBackendValueError,
                          IBMQBackendApiError, IBMQBackendApiProtocolError)
 from .job import IBMQJob
 from .utils import update_qobj_config, validate_job_tags
+from .utils.properties_cache import BackendPropertiesCache
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +91,8 @@ class IBMQBackend(BaseBackend):
             configuration: BackendConfiguration,
             provider: 'accountprovider.AccountProvider',
             credentials: Credentials,
-            api: AccountClient
+            api: AccountClient,
+            properties_cache: Optional[BackendPropertiesCache] = None
     ) -> None:
         """IBMQBackend constructor.
 
@@ -99,6 +101,8 @@ class IBMQBackend(BaseBackend):
             provider: IBM Quantum Experience account provider
             credentials: IBM Quantum Experience credentials.
             api: IBM Quantum Experience client used to communicate with the server.
+            properties_cache: Cache of backend properties, usually shared by
+                the backends of ``provider``. If ``None``, a new one is used.
         """
         super().__init__(provider=provider, configuration=configuration)
 
@@ -109,7 +113,7 @@ class IBMQBackend(BaseBackend):
         self.project = credentials.project
 
         # Attributes used by caching functions.
-        self._properties = None
+        self._properties_cache = properties_cache or BackendPropertiesCache(api)
         self._defaults = None
 
     def run(
@@ -177,7 +181,8 @@ class IBMQBackend(BaseBackend):
             qobj: Qobj,
             job_name: Optional[str] = None,
             job_share_level: Optional[ApiJobShareLevel] = None,
-            job_tags: Optional[List[str]] = None
+            job_tags: Optional[List[str]] = None,
+            created_callback: Optional[Callable[[], None]] = None
     ) -> IBMQJob:
         """Submit the Qobj to the backend.
 
@@ -189,6 +194,8 @@ class IBMQBackend(BaseBackend):
                 Job names do not need to be unique.
             job_share_level: Level the job should be shared at.
             job_tags: Tags to be assigned to the job.
+            created_callback: Function called, with no arguments, once the
+                remote job has been created and before the Qobj is uploaded.
 
         Returns:
             The job to be executed, an instance derived from BaseJob.
@@ -211,7 +218,8 @@ class IBMQBackend(BaseBackend):
                 qobj_dict=qobj_dict,
                 job_name=job_name,
                 job_share_level=job_share_level,
-                job_tags=job_tags)
+                job_tags=job_tags,
+                created_callback=created_callback)
         except ApiError as ex:
             raise IBMQBackendApiError('Error submitting job: {}'.format(str(ex))) from ex
 
@@ -243,6 +251,11 @@ class IBMQBackend(BaseBackend):
     ) -> Optional[BackendProperties]:
         """Return the backend properties, subject to optional filtering.
 
+        The properties are cached, and shared by the backends of the same
+        provider. The latest properties are revalidated with the server once
+        they are older than the ``ttl`` of the provider ``properties_cache``,
+        and properties for a past `datetime` are reused.
+
         Args:
             refresh: If ``True``, re-query the server for the backend properties.
                 Otherwise, return a cached version.
@@ -255,18 +268,7 @@ class IBMQBackend(BaseBackend):
             currently available.
         """
         # pylint: disable=arguments-differ
-        if datetime:
-            # Do not use cache for specific datetime properties.
-            api_properties = self._api.backend_properties(self.name(), datetime=datetime)
-            if not api_properties:
-                return None
-            return BackendProperties.from_dict(api_properties)
-
-        if refresh or self._properties is None:
-            api_properties = self._api.backend_properties(self.name())
-            self._properties = BackendProperties.from_dict(api_properties)
-
-        return self._properties
+        return self._properties_cache.properties(self.name(), refresh=refresh, datetime=datetime)
 
     def status(self) -> BackendStatus:
         """Return the backend status.
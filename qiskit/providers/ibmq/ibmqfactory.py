@@ -67,6 +67,15 @@ class IBMQFactory:
 
                 * proxies (dict): proxy configuration.
                 * verify (bool): verify the server's TLS certificate.
+                * connection_pool (dict): HTTP connection pool configuration,
+                  with the optional keys ``pool_connections``, ``pool_maxsize``,
+                  and ``pool_block``.
+                * result_cache (dict): cache job results on disk, using the
+                  optional keys ``directory`` and ``max_size`` (in bytes). An
+                  empty dictionary enables the cache with the default settings.
+                * configuration_cache (dict): cache backend configurations on
+                  disk, using the optional key ``directory``. An empty
+                  dictionary enables the cache with the default settings.
 
         Returns:
             The provider for the default open access project.
@@ -186,6 +195,9 @@ class IBMQFactory:
             **kwargs:
                 * proxies (dict): Proxy configuration for the server.
                 * verify (bool): If False, ignores SSL certificates errors
+                * connection_pool (dict): HTTP connection pool configuration.
+                * result_cache (dict): Job result cache configuration.
+                * configuration_cache (dict): Backend configuration cache configuration.
 
         Raises:
             IBMQAccountCredentialsInvalidUrl: If the URL is not a valid
@@ -391,6 +403,9 @@ class IBMQFactory:
                 websockets_url=service_urls['ws'],
                 proxies=credentials.proxies,
                 verify=credentials.verify,
+                connection_pool=credentials.connection_pool,
+                result_cache=credentials.result_cache,
+                configuration_cache=credentials.configuration_cache,
                 **hub_info, )
 
             # Build the provider.
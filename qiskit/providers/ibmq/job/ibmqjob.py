@@ -36,12 +36,14 @@ from ..apiconstants import ApiJobStatus, ApiJobKind
 from ..api.clients import AccountClient
 from ..api.exceptions import ApiError, UserTimeoutExceededError
 from ..utils.utils import RefreshQueue
+from ..utils.json_decoder import LazyJSONArray
 from .exceptions import (IBMQJobApiError, IBMQJobFailureError,
                          IBMQJobTimeoutError, IBMQJobInvalidStateError)
 from .queueinfo import QueueInfo
 from .schema import JobResponseSchema
 from .utils import (build_error_report, api_status_to_job_status,
-                    api_to_job_error, get_cancel_status)
+                    api_to_job_error, get_cancel_status, result_from_response,
+                    LazyExperimentResults)
 
 logger = logging.getLogger(__name__)
 
@@ -187,7 +189,8 @@ class IBMQJob(BaseModel, BaseJob):
             timeout: Optional[float] = None,
             wait: float = 5,
             partial: bool = False,
-            refresh: bool = False
+            refresh: bool = False,
+            eager: bool = False
     ) -> Result:
         """Return the result of the job.
 
@@ -220,6 +223,13 @@ class IBMQJob(BaseModel, BaseJob):
                 except QiskitError:
                     print("Experiment failed!")
 
+        Note:
+            By default, the result of each experiment is only validated and
+            converted when it is first accessed, which saves time for large
+            jobs where only some of the experiments are read. Validation errors
+            are then raised when accessing the experiment. Use ``eager=True``
+            to convert all of them before returning.
+
         If the job failed, you can use :meth:`error_message()` to get more information.
 
         Args:
@@ -228,6 +238,8 @@ class IBMQJob(BaseModel, BaseJob):
             partial: If ``True``, return partial results if possible.
             refresh: If ``True``, re-query the server for the result. Otherwise
                 return the cached value.
+            eager: If ``True``, validate and convert the results of all the
+                experiments before returning.
 
         Returns:
             Job result.
@@ -252,7 +264,7 @@ class IBMQJob(BaseModel, BaseJob):
                     'Unable to retrieve result for job {}. Job has failed. '
                     'Use job.error_message() to get more details.'.format(self.job_id()))
 
-        return self._retrieve_result(refresh=refresh)
+        return self._retrieve_result(refresh=refresh, eager=eager)
 
     def cancel(self) -> bool:
         """Attempt to cancel the job.
@@ -652,12 +664,14 @@ class IBMQJob(BaseModel, BaseJob):
 
         return self._status in required_status
 
-    def _retrieve_result(self, refresh: bool = False) -> Result:
+    def _retrieve_result(self, refresh: bool = False, eager: bool = False) -> Result:
         """Retrieve the job result response.
 
         Args:
             refresh: If ``True``, re-query the server for the result.
                Otherwise return the cached value.
+            eager: If ``True``, validate and convert the results of all the
+                experiments.
 
         Returns:
             The job result.
@@ -671,26 +685,28 @@ class IBMQJob(BaseModel, BaseJob):
         """
         # pylint: disable=access-member-before-definition,attribute-defined-outside-init
         result_response = None
-        if not self._result or refresh:  # type: ignore[has-type]
-            try:
+        try:
+            if not self._result or refresh:  # type: ignore[has-type]
                 result_response = self._api.job_result(self.job_id(), self._use_object_storage)
-                self._result = Result.from_dict(result_response)
-            except (ModelValidationError, ApiError) as err:
-                if self._status is JobStatus.ERROR:
-                    raise IBMQJobFailureError(
-                        'Unable to retrieve result for job {}. Job has failed. Use '
-                        'job.error_message() to get more details.'.format(self.job_id())) from err
-                if not self.kind:
-                    raise IBMQJobInvalidStateError(
-                        'Unable to retrieve result for job {}. Job result '
-                        'is in an unsupported format.'.format(self.job_id())) from err
-                raise IBMQJobApiError(
-                    'Unable to retrieve result for '
-                    'job {}: {}'.format(self.job_id(), str(err))) from err
-            finally:
-                # In case partial results are returned or job failure, an error message is cached.
-                if result_response:
-                    self._check_for_error_message(result_response)
+                self._result = result_from_response(result_response)
+            if eager and isinstance(self._result.results, LazyExperimentResults):
+                self._result.results = list(self._result.results)
+        except (ModelValidationError, ApiError) as err:
+            if self._status is JobStatus.ERROR:
+                raise IBMQJobFailureError(
+                    'Unable to retrieve result for job {}. Job has failed. Use '
+                    'job.error_message() to get more details.'.format(self.job_id())) from err
+            if not self.kind:
+                raise IBMQJobInvalidStateError(
+                    'Unable to retrieve result for job {}. Job result '
+                    'is in an unsupported format.'.format(self.job_id())) from err
+            raise IBMQJobApiError(
+                'Unable to retrieve result for '
+                'job {}: {}'.format(self.job_id(), str(err))) from err
+        finally:
+            # In case partial results are returned or job failure, an error message is cached.
+            if result_response:
+                self._check_for_error_message(result_response)
 
         if self._status is JobStatus.ERROR and not self._result.results:
             raise IBMQJobFailureError(
@@ -705,9 +721,13 @@ class IBMQJob(BaseModel, BaseJob):
         Args:
             result_response: Dictionary of the result response.
         """
-        if result_response.get('results', None):
+        results = result_response.get('results', None)
+        if results:
+            if isinstance(results, LazyJSONArray):
+                # Avoid decoding every experiment result.
+                results = results.summaries
             # If individual errors given
-            self._job_error_msg = build_error_report(result_response['results'])
+            self._job_error_msg = build_error_report(results)
         elif 'error' in result_response:
             self._job_error_msg = self._format_message_from_error(result_response['error'])
 
@@ -14,10 +14,14 @@
 
 """Utilities for working with IBM Quantum Experience jobs."""
 
-from typing import Dict, List, Generator, Any
+import threading
+from collections.abc import Sequence
+from typing import Dict, List, Generator, Any, Union, Tuple, Optional
 from contextlib import contextmanager
 
 from qiskit.providers.jobstatus import JobStatus
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResult
 
 from ..apiconstants import ApiJobStatus
 from ..api.exceptions import ApiError
@@ -90,3 +94,64 @@ def api_to_job_error() -> Generator[None, None, None]:
         yield
     except ApiError as api_err:
         raise IBMQJobApiError(str(api_err)) from api_err
+
+
+class LazyExperimentResults(Sequence):
+    """Experiment results that are converted to ``ExperimentResult`` when first accessed."""
+
+    def __init__(self, raw_results: Sequence) -> None:
+        """LazyExperimentResults constructor.
+
+        Args:
+            raw_results: Experiment results, in dictionary form.
+        """
+        self._raw_results = raw_results
+        self._results = [None] * len(raw_results)  # type: List[Optional[ExperimentResult]]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        with self._lock:
+            if self._results[index] is None:
+                self._results[index] = ExperimentResult.from_dict(self._raw_results[index])
+            return self._results[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazyExperimentResults)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __reduce__(self) -> Tuple:
+        # Pickle as a list, since the raw results might not be picklable.
+        return list, (list(self),)
+
+
+def result_from_response(result_response: Dict[str, Any]) -> Result:
+    """Build a ``Result`` from the job result response.
+
+    The top level fields of the response are validated right away, while each
+    experiment result is only validated and converted when it is first
+    accessed. If the experiment results are a
+    :class:`~qiskit.providers.ibmq.utils.json_decoder.LazyJSONArray`, they
+    are also decoded on first access.
+
+    Args:
+        result_response: The job result response.
+
+    Returns:
+        The job result.
+    """
+    raw_results = result_response.get('results', None)
+    if not isinstance(raw_results, Sequence) or isinstance(raw_results, str):
+        # Let the schema report the invalid value.
+        return Result.from_dict(result_response)
+
+    # Validate the rest of the result, then attach the experiment results.
+    result = Result.from_dict(dict(result_response, results=[]))
+    result.results = LazyExperimentResults(raw_results)
+    return result
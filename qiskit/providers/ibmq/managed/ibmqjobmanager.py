@@ -23,6 +23,7 @@ from qiskit.pulse import Schedule
 from qiskit.providers.ibmq.apiconstants import ApiJobShareLevel
 from qiskit.providers.ibmq.utils import validate_job_tags
 from qiskit.providers.ibmq.accountprovider import AccountProvider
+from qiskit.providers.ibmq.api.clients import AccountClient
 
 from .exceptions import IBMQJobManagerInvalidStateError
 from .utils import format_job_details, format_status_counts
@@ -153,6 +154,11 @@ class IBMQJobManager:
         experiment_list = self._split_experiments(
             experiments, backend=backend, max_experiments_per_job=max_experiments_per_job)
 
+        # Size the connection pool so every submit thread can reuse a connection.
+        # pylint: disable=protected-access
+        if isinstance(backend._api, AccountClient):
+            backend._api.ensure_pool_size(self._executor._max_workers)
+
         job_set = ManagedJobSet(name=name)
         job_set.run(experiment_list, backend=backend, executor=self._executor,
                     job_share_level=api_job_share_level, job_tags=job_tags, **run_config)
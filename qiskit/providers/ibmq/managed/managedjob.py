@@ -27,9 +27,11 @@ from qiskit.providers.jobstatus import JobStatus
 from qiskit.providers.exceptions import JobError
 from qiskit.providers.ibmq.apiconstants import ApiJobShareLevel, API_JOB_FINAL_STATES
 
+from ..ibmqbackend import IBMQSimulator
 from ..job.ibmqjob import IBMQJob
 from ..job.exceptions import IBMQJobTimeoutError
 from ..exceptions import IBMQBackendApiError
+from ..utils import update_qobj_config
 
 logger = logging.getLogger(__name__)
 
@@ -105,17 +107,36 @@ class ManagedJob:
             job_tags: Tags to be assigned to the job.
         """
         # pylint: disable=missing-raises-doc
+        lock_released = False
+
+        def _release_submit_lock() -> None:
+            """Release the submit lock, if it is still held by this job."""
+            nonlocal lock_released
+            if not lock_released:
+                lock_released = True
+                submit_lock.release()
+                logger.debug("Job %s released the submit lock.", job_name)
+
+        if isinstance(backend, IBMQSimulator):
+            # Same configuration handling as ``IBMQSimulator.run()``.
+            qobj = update_qobj_config(qobj)
+
         logger.debug("Job %s waiting for submit lock.", job_name)
         submit_lock.acquire()
         logger.debug("Job %s got the submit lock.", job_name)
         try:
             while self.job is None:
                 try:
-                    self.job = backend.run(
+                    # Only the job creation counts towards the job limit, so the
+                    # lock is released once the remote job exists, letting the
+                    # next job be created while this one is being uploaded.
+                    # pylint: disable=protected-access
+                    self.job = backend._submit_job(
                         qobj=qobj,
                         job_name=job_name,
-                        job_share_level=job_share_level.value,
-                        job_tags=job_tags)
+                        job_share_level=job_share_level,
+                        job_tags=job_tags,
+                        created_callback=_release_submit_lock)
                 except IBMQBackendApiError as api_err:
                     if 'Error code: 3458' in str(api_err):
                         final_states = [state.value for state in API_JOB_FINAL_STATES]
@@ -134,8 +155,7 @@ class ManagedJob:
                 self.start_index, self.end_index, err))
             self.submit_error = err
         finally:
-            submit_lock.release()
-            logger.debug("Job %s released the submit lock.", job_name)
+            _release_submit_lock()
 
     def status(self) -> Optional[JobStatus]:
         """Query the server for job status.
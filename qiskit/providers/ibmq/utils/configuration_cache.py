@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Persistent cache of backend configurations."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from qiskit import __version__ as terra_version
+from qiskit.providers.models import BackendConfiguration
+from qiskit.validation import BaseModel
+
+from ..version import __version__ as provider_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIGURATION_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.qiskit', 'backends')
+"""str: Default directory of the backend configuration cache."""
+
+_FORMAT_VERSION = 1
+
+
+class _ModelState:
+    """State of a model, restored without running its constructor."""
+
+    def __init__(self, model_cls: type, state: Dict[str, Any]) -> None:
+        """_ModelState constructor.
+
+        Args:
+            model_cls: Class of the model.
+            state: Attributes of the model.
+        """
+        self.model_cls = model_cls
+        self.state = state
+
+
+def _to_state(obj: Any) -> Any:
+    """Replace the models in ``obj`` with their state.
+
+    Pickling a model runs its constructor, and thus its validation, when it
+    is unpickled. Replacing it with its state avoids both.
+
+    Args:
+        obj: Object to convert.
+
+    Returns:
+        The converted object.
+    """
+    if isinstance(obj, BaseModel):
+        return _ModelState(type(obj), _to_state(vars(obj)))
+    if isinstance(obj, list):
+        return [_to_state(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _to_state(value) for key, value in obj.items()}
+    return obj
+
+
+def _from_state(obj: Any) -> Any:
+    """Restore the models replaced by :func:`_to_state`.
+
+    Args:
+        obj: Object to convert.
+
+    Returns:
+        The converted object.
+    """
+    if isinstance(obj, _ModelState):
+        model = obj.model_cls.__new__(obj.model_cls)
+        model.__dict__.update(_from_state(obj.state))
+        return model
+    if isinstance(obj, list):
+        return [_from_state(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _from_state(value) for key, value in obj.items()}
+    return obj
+
+
+class BackendConfigurationCache:
+    """Cache of the backend configurations of providers, stored in a directory.
+
+    The configurations of each provider are stored in a file, together with
+    the entity tag and digest of the server response they were built from.
+    They are restored without being validated again, so the cache is discarded
+    when ``qiskit-terra`` or ``qiskit-ibmq-provider`` are upgraded.
+
+    Note:
+        The files are stored using ``pickle``, so the directory must only be
+        writable by trusted users.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """BackendConfigurationCache constructor.
+
+        Args:
+            directory: Directory where the configurations are stored. If ``None``,
+                the default location is used (``$HOME/.qiskit/backends``).
+        """
+        self.directory = os.path.expanduser(directory or DEFAULT_CONFIGURATION_CACHE_DIR)
+
+    def _path(self, url: str) -> str:
+        """Return the path of the file for a provider.
+
+        Args:
+            url: URL of the provider.
+
+        Returns:
+            The path of the file.
+        """
+        file_name = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32] + '.pickle'
+        return os.path.join(self.directory, file_name)
+
+    @staticmethod
+    def _versions() -> tuple:
+        """Return the versions the stored configurations depend on."""
+        return _FORMAT_VERSION, terra_version, provider_version
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored backend configurations of a provider.
+
+        Args:
+            url: URL of the provider.
+
+        Returns:
+            ``None`` if no valid configurations are stored. Otherwise, a
+            dictionary with the following keys:
+
+                * ``configurations``: the list of backend configurations.
+                * ``etag``: the entity tag of the server response, if any.
+                * ``digest``: the digest of the server response.
+        """
+        try:
+            with open(self._path(url), 'rb') as cache_file:
+                stored = pickle.load(cache_file)
+            if stored['versions'] != self._versions() or stored['url'] != url:
+                return None
+            return {'configurations': _from_state(stored['configurations']),
+                    'etag': stored['etag'],
+                    'digest': stored['digest']}
+        except FileNotFoundError:
+            return None
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning('Unable to read the cached backend configurations: %s', ex)
+            return None
+
+    def save(
+            self,
+            url: str,
+            configurations: List[BackendConfiguration],
+            etag: Optional[str],
+            digest: str
+    ) -> None:
+        """Store the backend configurations of a provider.
+
+        Args:
+            url: URL of the provider.
+            configurations: The backend configurations.
+            etag: The entity tag of the server response, if any.
+            digest: The digest of the server response.
+        """
+        stored = {'versions': self._versions(),
+                  'url': url,
+                  'configurations': _to_state(configurations),
+                  'etag': etag,
+                  'digest': digest}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first, so readers never see a partial file.
+            temp_fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(temp_fd, 'wb') as temp_file:
+                    pickle.dump(stored, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._path(url))
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        except (OSError, pickle.PicklingError) as ex:
+            logger.warning('Unable to cache the backend configurations: %s', ex)
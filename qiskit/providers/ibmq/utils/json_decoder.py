@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Incremental JSON decoding of large documents."""
+
+import json
+import re
+import threading
+from collections.abc import Sequence
+from typing import Any, Dict, List, Tuple, IO, Iterable, Union
+
+from .json_encoder import CHUNK_SIZE
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_NON_ASCII = re.compile('[\x80-\xff]')
+
+
+class LazyJSONArray(Sequence):
+    """A JSON array whose elements are decoded from a file when accessed.
+
+    Elements are decoded each time they are accessed and are not cached.
+    Callers that access an element repeatedly should keep a reference to it.
+    """
+
+    def __init__(
+            self,
+            file: IO[bytes],
+            spans: List[Tuple[int, int]],
+            summaries: List[Dict[str, Any]]
+    ) -> None:
+        """LazyJSONArray constructor.
+
+        Args:
+            file: Binary file object containing the document.
+            spans: Offset and length, in bytes, of each element in ``file``.
+            summaries: Selected fields of each element, decoded in advance.
+        """
+        self._file = file
+        self._spans = spans
+        self._lock = threading.Lock()
+        self.summaries = summaries
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        offset, length = self._spans[index]
+        with self._lock:
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return json.loads(data.decode('utf-8'))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazyJSONArray)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __reduce__(self) -> Tuple:
+        # Pickle the decoded elements, since the file cannot be pickled.
+        return list, (list(self),)
+
+
+class _IncrementalReader:
+    """Read JSON values from a binary file, keeping a bounded buffer in memory.
+
+    The file is decoded as ``latin-1``, which maps every byte to one character,
+    so positions in the buffer match byte offsets in the file. Values with
+    non-ASCII content are decoded again as UTF-8.
+    """
+
+    def __init__(self, file: IO[bytes], chunk_size: int = CHUNK_SIZE) -> None:
+        """_IncrementalReader constructor.
+
+        Args:
+            file: Binary file object to read from.
+            chunk_size: Minimum number of bytes read at a time.
+        """
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._buffer_offset = 0  # Offset of the buffer in the file.
+        self._pos = 0  # Position in the buffer.
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        """Append data from the file to the buffer, discarding what was consumed.
+
+        Returns:
+            ``False`` if the end of the file was reached.
+        """
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._buffer_offset += self._pos
+            self._pos = 0
+        # Read at least as much as is buffered, so values that span several
+        # reads are retried a logarithmic number of times.
+        data = self._file.read(max(self._chunk_size, len(self._buffer)))
+        if not data:
+            self._eof = True
+            return False
+        self._buffer += data.decode('latin-1')
+        return True
+
+    def next_char(self) -> str:
+        """Consume and return the next non-whitespace character.
+
+        Returns:
+            The character.
+
+        Raises:
+            ValueError: If the end of the file was reached.
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                self._pos += 1
+                return self._buffer[self._pos-1]
+            if not self._read_more():
+                raise ValueError('Unexpected end of JSON document.')
+
+    def peek_char(self) -> str:
+        """Return the next non-whitespace character, without consuming it.
+
+        Returns:
+            The character.
+        """
+        char = self.next_char()
+        self._pos -= 1
+        return char
+
+    def read_value(self) -> Tuple[Any, int, int]:
+        """Decode the next value.
+
+        Returns:
+            A tuple of the value and its start and end offsets in the file.
+
+        Raises:
+            JSONDecodeError: If the value is not valid JSON.
+        """
+        self.peek_char()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer might continue in the file.
+                if end < len(self._buffer) or self._eof:
+                    break
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read_more()
+
+        if _NON_ASCII.search(self._buffer, self._pos, end):
+            text = self._buffer[self._pos:end].encode('latin-1').decode('utf-8')
+            value = json.loads(text)
+        start = self._buffer_offset + self._pos
+        self._pos = end
+        return value, start, self._buffer_offset + end
+
+
+def load_lazy(
+        file: IO[bytes],
+        lazy_keys: Iterable[str],
+        summary_keys: Iterable[str] = (),
+        chunk_size: int = CHUNK_SIZE
+) -> Dict[str, Any]:
+    """Decode a JSON object from a file, leaving some of its arrays undecoded.
+
+    The file is read incrementally. The top level values under ``lazy_keys``
+    are returned as :class:`LazyJSONArray` instances that decode each element
+    from ``file`` when it is accessed, so ``file`` must be kept open while
+    they are in use.
+
+    Args:
+        file: Binary file object, positioned at the start of a JSON object.
+        lazy_keys: Top level keys whose arrays are decoded lazily.
+        summary_keys: Fields of the lazy array elements that are decoded in advance
+            and made available in :attr:`LazyJSONArray.summaries`.
+        chunk_size: Minimum number of bytes read from ``file`` at a time.
+
+    Returns:
+        The decoded object.
+
+    Raises:
+        ValueError: If the document is not a valid JSON object.
+    """
+    lazy_keys = set(lazy_keys)
+    summary_keys = tuple(summary_keys)
+    reader = _IncrementalReader(file, chunk_size)
+    decoded = {}  # type: Dict[str, Any]
+
+    if reader.next_char() != '{':
+        raise ValueError('The JSON document is not an object.')
+    if reader.peek_char() == '}':
+        return decoded
+
+    while True:
+        key, _, _ = reader.read_value()
+        if reader.next_char() != ':':
+            raise ValueError('Expected ":" after key "{}".'.format(key))
+        if key in lazy_keys and reader.peek_char() == '[':
+            reader.next_char()
+            spans = []
+            summaries = []
+            if reader.peek_char() == ']':
+                reader.next_char()
+            else:
+                while True:
+                    value, start, end = reader.read_value()
+                    spans.append((start, end-start))
+                    if isinstance(value, dict):
+                        summaries.append({summary_key: value[summary_key]
+                                          for summary_key in summary_keys
+                                          if summary_key in value})
+                    else:
+                        summaries.append({})
+                    separator = reader.next_char()
+                    if separator == ']':
+                        break
+                    if separator != ',':
+                        raise ValueError('Expected "," or "]" in array "{}".'.format(key))
+            decoded[key] = LazyJSONArray(file, spans, summaries)
+        else:
+            decoded[key], _, _ = reader.read_value()
+
+        separator = reader.next_char()
+        if separator == '}':
+            return decoded
+        if separator != ',':
+            raise ValueError('Expected "," or "}}" after key "{}".'.format(key))
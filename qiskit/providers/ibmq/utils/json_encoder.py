@@ -16,11 +16,21 @@
 
 """Custom JSON encoders."""
 
+import io
 import json
-from typing import Any
+import tempfile
+import zlib
+from typing import Any, Iterator, Iterable, IO
 
 from qiskit.circuit.parameterexpression import ParameterExpression
 
+CHUNK_SIZE = 64 * 1024
+"""Size, in bytes, of the chunks yielded by :func:`iter_json_chunks`."""
+SPOOL_MAX_MEMORY_SIZE = 8 * 1024 * 1024
+"""Size, in bytes, above which :func:`write_to_spool` writes to a temporary file."""
+_SPLIT_DEPTH = 3
+"""Nesting depth up to which containers are encoded piece by piece."""
+
 
 class IQXJsonEconder(json.JSONEncoder):
     """A json encoder for qobj"""
@@ -35,3 +45,130 @@ class IQXJsonEconder(json.JSONEncoder):
         if isinstance(o, ParameterExpression):
             return float(o)
         return json.JSONEncoder.default(self, o)
+
+
+def _iter_json_pieces(obj: Any, encoder: json.JSONEncoder, depth: int) -> Iterator[str]:
+    """Encode ``obj`` to JSON, one piece at a time.
+
+    Dictionaries and lists above ``depth`` levels of nesting are emitted
+    element by element, and the rest is encoded at once by ``encoder``,
+    which keeps the pieces small while using the fast encoder for the leaves.
+
+    Args:
+        obj: Object to encode.
+        encoder: Encoder used for the leaves.
+        depth: Remaining nesting levels to split.
+
+    Yields:
+        Pieces of the JSON document.
+    """
+    if depth and isinstance(obj, dict) and all(isinstance(key, str) for key in obj):
+        yield '{'
+        for index, (key, value) in enumerate(obj.items()):
+            yield '{}{}: '.format(', ' if index else '', encoder.encode(key))
+            yield from _iter_json_pieces(value, encoder, depth-1)
+        yield '}'
+    elif depth and isinstance(obj, (list, tuple)):
+        yield '['
+        for index, value in enumerate(obj):
+            if index:
+                yield ', '
+            yield from _iter_json_pieces(value, encoder, depth-1)
+        yield ']'
+    else:
+        yield encoder.encode(obj)
+
+
+def iter_json_chunks(
+        obj: Any,
+        compress: bool = False,
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Serialize ``obj`` to JSON using :class:`IQXJsonEconder`, in chunks.
+
+    The output is the same as ``json.dumps(obj, cls=IQXJsonEconder)``, but the
+    whole document is never held in memory at once.
+
+    Args:
+        obj: Object to serialize.
+        compress: Whether to gzip the output.
+        chunk_size: Approximate size of each chunk, in bytes.
+
+    Yields:
+        Chunks of the UTF-8 encoded, and optionally gzipped, JSON document.
+    """
+    encoder = IQXJsonEconder()
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+    buffer = []
+    buffer_size = 0
+
+    for piece in _iter_json_pieces(obj, encoder, _SPLIT_DEPTH):
+        buffer.append(piece)
+        buffer_size += len(piece)
+        if buffer_size >= chunk_size:
+            chunk = ''.join(buffer).encode('utf-8')
+            buffer = []
+            buffer_size = 0
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+    chunk = ''.join(buffer).encode('utf-8')
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def write_to_spool(
+        chunks: Iterable[bytes],
+        max_memory_size: int = SPOOL_MAX_MEMORY_SIZE
+) -> IO[bytes]:
+    """Write chunks of bytes into a file object.
+
+    The chunks are kept in memory while their total size is smaller than
+    ``max_memory_size``, and written to a temporary file otherwise.
+
+    Args:
+        chunks: Chunks to write.
+        max_memory_size: Size, in bytes, above which a temporary file is used.
+
+    Returns:
+        A binary file object with the chunks, positioned at the start.
+        The caller is responsible for closing it.
+    """
+    spool = io.BytesIO()  # type: IO[bytes]
+    in_memory = True
+    for chunk in chunks:
+        if in_memory and spool.tell() + len(chunk) > max_memory_size:
+            temp_file = tempfile.TemporaryFile()
+            temp_file.write(spool.getvalue())  # type: ignore[attr-defined]
+            spool.close()
+            spool = temp_file
+            in_memory = False
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def dump_to_spool(
+        obj: Any,
+        compress: bool = False,
+        max_memory_size: int = SPOOL_MAX_MEMORY_SIZE
+) -> IO[bytes]:
+    """Serialize ``obj`` to JSON into a file object, using :class:`IQXJsonEconder`.
+
+    The output is written with :func:`write_to_spool`, so it can be uploaded
+    with a known length without holding large documents in memory.
+
+    Args:
+        obj: Object to serialize.
+        compress: Whether to gzip the output.
+        max_memory_size: Size, in bytes, above which a temporary file is used.
+
+    Returns:
+        A binary file object with the serialized document, positioned at the start.
+        The caller is responsible for closing it.
+    """
+    return write_to_spool(iter_json_chunks(obj, compress=compress), max_memory_size)
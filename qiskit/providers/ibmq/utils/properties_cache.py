@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of backend properties."""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime as python_datetime, timezone
+from typing import Dict, Optional, Tuple, Any
+
+from qiskit.providers.models import BackendProperties
+
+from ..api.clients import AccountClient
+
+DEFAULT_PROPERTIES_TTL = 300
+"""int: Default number of seconds the latest backend properties are used before revalidation."""
+DEFAULT_MAX_HISTORICAL = 128
+"""int: Default maximum number of historical backend properties kept."""
+
+
+class BackendPropertiesCache:
+    """Cache of the properties of the backends of a provider.
+
+    The latest properties of each backend are used for ``ttl`` seconds. After
+    that, they are downloaded again, but only converted to
+    :class:`~qiskit.providers.models.BackendProperties` if their
+    ``last_update_date`` changed. Properties retrieved for a ``datetime`` in the
+    past do not change, and are kept until ``max_historical`` more recently
+    used ones are cached.
+    """
+
+    def __init__(
+            self,
+            api: AccountClient,
+            ttl: Optional[float] = DEFAULT_PROPERTIES_TTL,
+            max_historical: int = DEFAULT_MAX_HISTORICAL
+    ) -> None:
+        """BackendPropertiesCache constructor.
+
+        Args:
+            api: IBM Quantum Experience client used to communicate with the server.
+            ttl: Number of seconds the latest properties of a backend are used
+                before they are revalidated. If ``None``, they are used until
+                they are explicitly refreshed.
+            max_historical: Maximum number of properties kept for past dates.
+        """
+        self._api = api
+        self.ttl = ttl
+        self.max_historical = max_historical
+        self._lock = threading.Lock()
+        # Latest properties, as (properties, last update date, time of retrieval).
+        self._latest = {}  # type: Dict[str, Tuple[Optional[BackendProperties], Any, float]]
+        # Properties for past dates, in least recently used order.
+        self._historical = OrderedDict()  # type: OrderedDict
+        self._stats = {'hits': 0, 'misses': 0, 'revalidations': 0}
+
+    def properties(
+            self,
+            backend_name: str,
+            refresh: bool = False,
+            datetime: Optional[python_datetime] = None
+    ) -> Optional[BackendProperties]:
+        """Return the properties of a backend.
+
+        Args:
+            backend_name: The name of the backend.
+            refresh: If ``True``, revalidate the latest properties even if they
+                are not expired. Ignored if ``datetime`` is specified.
+            datetime: Date and time for retrieving past backend properties.
+
+        Returns:
+            The backend properties, or ``None`` if they are not available.
+        """
+        # pylint: disable=redefined-outer-name
+        if datetime:
+            return self._historical_properties(backend_name, datetime)
+
+        with self._lock:
+            cached = self._latest.get(backend_name, None)
+            if cached and not refresh and not self._expired(cached[2]):
+                self._stats['hits'] += 1
+                return cached[0]
+
+        api_properties = self._api.backend_properties(backend_name)
+        last_update_date = api_properties.get('last_update_date', None) \
+            if api_properties else None
+        with self._lock:
+            cached = self._latest.get(backend_name, None)
+            if cached and last_update_date and cached[1] == last_update_date:
+                # The properties did not change, only extend their lifetime.
+                self._stats['revalidations'] += 1
+                properties = cached[0]
+            else:
+                self._stats['misses'] += 1
+                properties = BackendProperties.from_dict(api_properties) \
+                    if api_properties else None
+            self._latest[backend_name] = (properties, last_update_date, time.monotonic())
+        return properties
+
+    def _historical_properties(
+            self,
+            backend_name: str,
+            datetime: python_datetime
+    ) -> Optional[BackendProperties]:
+        """Return the properties of a backend at a date.
+
+        Args:
+            backend_name: The name of the backend.
+            datetime: Date and time for retrieving past backend properties.
+
+        Returns:
+            The backend properties, or ``None`` if they are not available.
+        """
+        # pylint: disable=redefined-outer-name
+        key = (backend_name, datetime)
+        with self._lock:
+            if key in self._historical:
+                self._stats['hits'] += 1
+                self._historical.move_to_end(key)
+                return self._historical[key]
+            self._stats['misses'] += 1
+
+        api_properties = self._api.backend_properties(backend_name, datetime=datetime)
+        properties = BackendProperties.from_dict(api_properties) if api_properties else None
+
+        # Newer properties might still be published for a date in the future.
+        if _is_past(datetime):
+            with self._lock:
+                self._historical[key] = properties
+                while len(self._historical) > self.max_historical:
+                    self._historical.popitem(last=False)
+        return properties
+
+    def _expired(self, retrieved_at: float) -> bool:
+        """Return whether properties retrieved at ``retrieved_at`` are expired."""
+        return self.ttl is not None and time.monotonic() - retrieved_at >= self.ttl
+
+    def clear(self) -> None:
+        """Remove all cached properties."""
+        with self._lock:
+            self._latest.clear()
+            self._historical.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return statistics about the use of the cache.
+
+        Returns:
+            A dictionary with the following keys:
+
+                * ``hits``: number of properties returned from the cache.
+                * ``misses``: number of properties downloaded and converted.
+                * ``revalidations``: number of expired properties downloaded
+                  again and found unchanged, which were not converted again.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+def _is_past(datetime: python_datetime) -> bool:
+    """Return whether ``datetime`` is in the past.
+
+    Naive dates are only considered in the past if they are in the past both
+    as local and as UTC times.
+
+    Args:
+        datetime: Date and time to check.
+
+    Returns:
+        ``True`` if ``datetime`` is in the past.
+    """
+    # pylint: disable=redefined-outer-name
+    if datetime.tzinfo:
+        return datetime < python_datetime.now(timezone.utc)
+    return datetime < min(python_datetime.now(), python_datetime.utcnow())
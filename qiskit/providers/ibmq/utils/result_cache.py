@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Persistent cache of job results."""
+
+import gzip
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from typing import Optional, List, Tuple, IO
+
+from .json_encoder import CHUNK_SIZE, write_to_spool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.qiskit', 'results')
+"""str: Default directory of the result cache."""
+DEFAULT_RESULT_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+"""int: Default maximum size, in bytes, of the result cache."""
+
+_FILE_SUFFIX = '.json.gz'
+_JOB_ID_REGEX = re.compile(r'^[\w\-]+$')
+
+
+class ResultCache:
+    """Cache of job results, stored as gzipped JSON files in a directory.
+
+    Each result is stored in a file named after its job ID. Reading a result
+    updates the modification time of its file, and the least recently used
+    results are removed when the total size of the files exceeds ``max_size``.
+    """
+
+    def __init__(
+            self,
+            directory: Optional[str] = None,
+            max_size: int = DEFAULT_RESULT_CACHE_MAX_SIZE
+    ) -> None:
+        """ResultCache constructor.
+
+        Args:
+            directory: Directory where the results are stored. If ``None``,
+                the default location is used (``$HOME/.qiskit/results``).
+            max_size: Maximum total size, in bytes, of the stored results.
+        """
+        self.directory = os.path.expanduser(directory or DEFAULT_RESULT_CACHE_DIR)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def _path(self, job_id: str) -> Optional[str]:
+        """Return the path of the file for a job result.
+
+        Args:
+            job_id: The ID of the job.
+
+        Returns:
+            The path of the file, or ``None`` if ``job_id`` cannot be used
+            as a file name.
+        """
+        if not _JOB_ID_REGEX.match(job_id):
+            return None
+        return os.path.join(self.directory, job_id + _FILE_SUFFIX)
+
+    def get(self, job_id: str) -> Optional[IO[bytes]]:
+        """Return a stored job result.
+
+        Args:
+            job_id: The ID of the job.
+
+        Returns:
+            A binary file object with the JSON result, positioned at the start,
+            or ``None`` if the result is not stored. The caller is responsible
+            for closing it.
+        """
+        path = self._path(job_id)
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, 'rb') as cache_file:
+                result_file = write_to_spool(iter(lambda: cache_file.read(CHUNK_SIZE), b''))
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as ex:
+            logger.warning('Unable to read the cached result of job %s: %s', job_id, ex)
+            self._remove(path)
+            return None
+        return result_file
+
+    def put(self, job_id: str, result_file: IO[bytes]) -> None:
+        """Store a job result.
+
+        The contents of ``result_file`` are copied, and the file is positioned
+        back at the start afterwards.
+
+        Args:
+            job_id: The ID of the job.
+            result_file: Binary file object with the JSON result, positioned
+                at the start.
+        """
+        path = self._path(job_id)
+        if path is None:
+            return
+        try:
+            self._write(path, result_file)
+        except OSError as ex:
+            logger.warning('Unable to cache the result of job %s: %s', job_id, ex)
+        finally:
+            result_file.seek(0)
+
+        self.evict()
+
+    def _write(self, path: str, result_file: IO[bytes]) -> None:
+        """Write a gzipped copy of a job result.
+
+        The copy is written to a temporary file first, so readers never see
+        a partial result.
+
+        Args:
+            path: Path of the file for the job result.
+            result_file: Binary file object with the JSON result.
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'wb') as temp_file, \
+                    gzip.GzipFile(fileobj=temp_file, mode='wb') as gzip_file:
+                shutil.copyfileobj(result_file, gzip_file, CHUNK_SIZE)
+            os.replace(temp_path, path)
+        except OSError:
+            self._remove(temp_path)
+            raise
+
+    def evict(self) -> None:
+        """Remove the least recently used results until the cache fits in ``max_size``."""
+        with self._lock:
+            entries = self._entries()
+            total_size = sum(size for _, _, size in entries)
+            for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+                if total_size <= self.max_size:
+                    break
+                self._remove(path)
+                total_size -= size
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                self._remove(path)
+
+    def size(self) -> int:
+        """Return the total size of the stored results.
+
+        Returns:
+            The size, in bytes.
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """Return the files of the stored results.
+
+        Returns:
+            A list of the path, modification time and size of each file.
+        """
+        entries = []
+        try:
+            file_names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for file_name in file_names:
+            if not file_name.endswith(_FILE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, file_name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Remove a file, ignoring errors.
+
+        Args:
+            path: Path of the file.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
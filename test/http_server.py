@@ -14,9 +14,12 @@
 
 """HTTP server for testing purposes."""
 
+import hashlib
 import threading
 import json
+import time
 from typing import Optional
+from socketserver import ThreadingMixIn
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
 
@@ -75,6 +78,84 @@ class ServerErrorOnceHandler(BaseHandler):
         return self.valid_data
 
 
+class KeepAliveHandler(BaseHandler):
+    """Request handler that keeps the connection open between requests."""
+
+    protocol_version = 'HTTP/1.1'
+    valid_data = {}
+    request_body = b''
+
+    def _get_response_data(self):
+        """Return valid response data."""
+        return self.valid_data
+
+    def _respond(self):
+        """Respond to the client, specifying the length of the body."""
+        self.request_body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        body = json.dumps(self._get_response_data()).encode(encoding='utf_8')
+        self.send_response(self._get_code())
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        """Do not log the requests."""
+        # pylint: disable=arguments-differ
+        pass
+
+
+class LatencyHandler(KeepAliveHandler):
+    """Request handler that delays every response and records the requests."""
+
+    latency = 0.05
+    requests_seen = []
+    uploads_seen = []
+
+    def _get_response_data(self):
+        """Record the headers and body of uploads, and return valid response data."""
+        if self.command == 'PUT':
+            self.uploads_seen.append((self.headers, self.request_body))
+        return super()._get_response_data()
+
+    def _respond(self):
+        """Record the request and respond after ``latency`` seconds."""
+        self.requests_seen.append((self.command, self.path))
+        time.sleep(self.latency)
+        super()._respond()
+
+
+class ETagHandler(KeepAliveHandler):
+    """Request handler that supports conditional requests using entity tags."""
+
+    send_etag = True
+    status_codes_sent = []
+
+    def _respond(self):
+        """Respond with ``304 Not Modified`` if the entity tag matches."""
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        body = json.dumps(self._get_response_data()).encode(encoding='utf_8')
+        etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+        code = 304 if self.headers.get('If-None-Match') == etag else 200
+        self.status_codes_sent.append(code)
+        self.send_response(code)
+        if self.send_etag:
+            self.send_header('ETag', etag)
+        if code == 304:
+            self.end_headers()
+            return
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """HTTP server that handles each request in a separate thread."""
+
+    daemon_threads = True
+
+
 class SimpleServer:
     """A simple test HTTP server."""
 
@@ -82,15 +163,27 @@ class SimpleServer:
     PORT = 8123
     URL = "http://{}:{}".format(IP_ADDRESS, PORT)
 
-    def __init__(self, handler_class: BaseHandler, valid_data: Optional[dict] = None):
+    def __init__(
+            self,
+            handler_class: BaseHandler,
+            valid_data: Optional[dict] = None,
+            port: Optional[int] = None,
+            threaded: bool = False
+    ):
         """SimpleServer constructor.
 
         Args:
             handler_class: Request handler class.
             valid_data: Data to be returned for a valid request.
+            port: Port to listen on. If ``None``, ``PORT`` is used.
+            threaded: Whether to handle the requests concurrently.
         """
+        if port is not None:
+            self.PORT = port  # pylint: disable=invalid-name
+            self.URL = "http://{}:{}".format(self.IP_ADDRESS, port)  # pylint: disable=invalid-name
         setattr(handler_class, 'valid_data', valid_data)
-        httpd = HTTPServer((self.IP_ADDRESS, self.PORT), handler_class)
+        server_class = ThreadingHTTPServer if threaded else HTTPServer
+        httpd = server_class((self.IP_ADDRESS, self.PORT), handler_class)
         self.server = threading.Thread(target=httpd.serve_forever, daemon=True)
 
     def start(self):
@@ -14,8 +14,14 @@
 
 """Tests for the AccountClient class."""
 
+import gzip
+import json
 import re
+import tempfile
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from unittest import mock
 from urllib3.connectionpool import HTTPConnectionPool
 from urllib3.exceptions import MaxRetryError
@@ -28,11 +34,14 @@ from qiskit.providers.ibmq.api.exceptions import ApiError, RequestsApiError
 from qiskit.providers.ibmq.job.utils import get_cancel_status
 from qiskit.providers.jobstatus import JobStatus
 from qiskit.providers.ibmq.utils.utils import RefreshQueue
+from qiskit.providers.ibmq.utils.json_decoder import LazyJSONArray
+from qiskit.providers.ibmq.utils.result_cache import ResultCache
 
 from ..ibmqtestcase import IBMQTestCase
 from ..decorators import requires_qe_access, requires_device, requires_provider
 from ..contextmanagers import custom_envs, no_envs
-from ..http_server import SimpleServer, ServerErrorOnceHandler
+from ..http_server import (SimpleServer, ServerErrorOnceHandler, KeepAliveHandler,
+                           LatencyHandler)
 
 
 class TestAccountClient(IBMQTestCase):
@@ -254,6 +263,173 @@ class TestAccountClient(IBMQTestCase):
         api.job_submit(backend_name, {})
 
 
+class TestAccountClientConnectionPool(IBMQTestCase):
+    """Tests for the connection pool used by the AccountClient."""
+
+    def test_connection_reuse(self):
+        """Test connections are reused between requests."""
+        server = SimpleServer(handler_class=KeepAliveHandler, valid_data=[], port=8124)
+        server.start()
+        client = AccountClient('dummy_token', server.URL, 'ws://127.0.0.1',
+                               use_websockets=False)
+
+        for _ in range(5):
+            client.list_backends()
+
+        stats = client.pool_stats()
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 4)
+
+    def test_ensure_pool_size(self):
+        """Test growing the connection pools."""
+        client = AccountClient('dummy_token', 'https://127.0.0.1', 'ws://127.0.0.1',
+                               use_websockets=False, pool_maxsize=2, pool_block=True)
+        session = client.client_api.session
+
+        client.ensure_pool_size(20)
+        adapter = session.get_adapter('https://127.0.0.1')
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertTrue(adapter._pool_block)
+        self.assertIs(adapter.max_retries, session.get_adapter('http://127.0.0.1').max_retries)
+
+        # Pools are never shrunk.
+        client.ensure_pool_size(5)
+        self.assertEqual(session.get_adapter('https://127.0.0.1')._pool_maxsize, 20)
+
+
+class TestAccountClientObjectStorage(IBMQTestCase):
+    """Tests for the object storage requests of the AccountClient."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Initial class level setup."""
+        super().setUpClass()
+        cls.server = SimpleServer(handler_class=LatencyHandler, port=8125, threaded=True)
+        cls.server.start()
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        LatencyHandler.requests_seen = []
+        LatencyHandler.uploads_seen = []
+        LatencyHandler.valid_data = {'id': 'fake_id', 'url': self.server.URL,
+                                     'job': {'id': 'fake_id'}}
+        self.client = AccountClient('dummy_token', self.server.URL, 'ws://127.0.0.1',
+                                    use_websockets=False, pool_maxsize=10)
+
+    def test_upload_url_in_response(self):
+        """Test the upload URL returned with the remote job is used."""
+        LatencyHandler.valid_data['objectStorageInfo'] = {'uploadUrl': self.server.URL}
+
+        job = self.client.job_submit('ibmq_qasm_simulator', {'qobj_id': 'fake'})
+        self.assertEqual(job['id'], 'fake_id')
+        self.assertEqual([method for method, _ in LatencyHandler.requests_seen],
+                         ['POST', 'PUT', 'POST'])
+
+    def test_upload_url_requested(self):
+        """Test the upload URL is requested if not returned with the remote job."""
+        self.client.job_submit('ibmq_qasm_simulator', {'qobj_id': 'fake'})
+        self.assertIn(('GET', '/Jobs/fake_id/jobUploadUrl'), LatencyHandler.requests_seen)
+        self.assertEqual(len(LatencyHandler.requests_seen), 4)
+
+    def test_created_callback(self):
+        """Test the created callback is called before the Qobj is uploaded."""
+        requests_at_callback = []
+        self.client.job_submit(
+            'ibmq_qasm_simulator', {'qobj_id': 'fake'},
+            created_callback=lambda: requests_at_callback.append(
+                list(LatencyHandler.requests_seen)))
+        self.assertEqual(requests_at_callback, [[('POST', '/Jobs')]])
+
+    def test_upload_body(self):
+        """Test the Qobj is uploaded with a known length."""
+        qobj_dict = {'qobj_id': 'fake', 'experiments': [{'instructions': list(range(100))}]}
+        self.client.job_submit('ibmq_qasm_simulator', qobj_dict)
+
+        headers, body = LatencyHandler.uploads_seen[0]
+        self.assertEqual(int(headers['Content-Length']), len(body))
+        self.assertEqual(json.loads(body.decode('utf-8')), qobj_dict)
+
+    def test_upload_body_compressed(self):
+        """Test the Qobj can be uploaded gzipped."""
+        qobj_dict = {'qobj_id': 'fake', 'experiments': [{'instructions': list(range(100))}]}
+        self.client.client_api.job('fake_id').put_object_storage(
+            self.server.URL, qobj_dict, compress=True)
+
+        headers, body = LatencyHandler.uploads_seen[0]
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(body).decode('utf-8')), qobj_dict)
+
+    def test_result_download(self):
+        """Test the result is downloaded and its experiments decoded lazily."""
+        experiment_results = [{'success': True, 'data': {'memory': ['0x1'] * 1000}}] * 50
+        LatencyHandler.valid_data.update({'status': 'COMPLETED', 'results': experiment_results})
+
+        result = self.client.job_result('fake_id', use_object_storage=True)
+        self.assertIsInstance(result['results'], LazyJSONArray)
+        self.assertEqual(result['results'].summaries, [{'success': True}] * 50)
+        self.assertEqual(result['results'][49], experiment_results[49])
+        self.assertEqual(result['status'], 'COMPLETED')
+        self.assertEqual([method for method, _ in LatencyHandler.requests_seen],
+                         ['GET', 'GET', 'POST'])
+
+    def test_result_cache(self):
+        """Test the result is cached and read from the cache afterwards."""
+        experiment_results = [{'success': True, 'data': {'memory': ['0x1'] * 10}}] * 5
+        result_response = {'status': 'COMPLETED', 'results': experiment_results}
+        LatencyHandler.valid_data.update(result_response, qObjectResult=result_response)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.client.result_cache = ResultCache(cache_dir)
+            for use_object_storage in [True, False]:
+                with self.subTest(use_object_storage=use_object_storage):
+                    self.client.result_cache.clear()
+                    first = self.client.job_result('fake_id', use_object_storage)
+                    LatencyHandler.requests_seen = []
+                    cached = self.client.job_result('fake_id', use_object_storage)
+                    self.assertEqual(LatencyHandler.requests_seen, [])
+                    self.assertIsInstance(cached['results'], LazyJSONArray)
+                    self.assertEqual(cached['results'], experiment_results)
+                    self.assertEqual(cached['status'], first['status'])
+
+    def test_pipelined_submit(self):
+        """Benchmark submitting jobs while only serializing the job creation."""
+        jobs_count = 8
+        qobj_dict = {'qobj_id': 'fake', 'experiments': [{'instructions': list(range(10000))}]}
+
+        def _submit(pipelined):
+            submit_lock = Lock()
+
+            def _locked_submit():
+                submit_lock.acquire()
+                released = []
+
+                def _release():
+                    if not released:
+                        released.append(True)
+                        submit_lock.release()
+                try:
+                    self.client.job_submit(
+                        'ibmq_qasm_simulator', qobj_dict,
+                        created_callback=_release if pipelined else None)
+                finally:
+                    _release()
+
+            start_time = time.time()
+            with ThreadPoolExecutor(max_workers=jobs_count) as executor:
+                for future in [executor.submit(_locked_submit) for _ in range(jobs_count)]:
+                    future.result()
+            return time.time() - start_time
+
+        serial_time = _submit(pipelined=False)
+        pipelined_time = _submit(pipelined=True)
+        self.log.info('Submitted %s jobs in %.3fs serially and %.3fs pipelined.',
+                      jobs_count, serial_time, pipelined_time)
+        self.assertEqual(len(LatencyHandler.requests_seen), 2 * jobs_count * 4)
+        self.assertLess(pipelined_time, serial_time)
+
+
 class TestAccountClientJobs(IBMQTestCase):
     """Tests for AccountClient methods related to jobs.
 
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the backend configuration cache."""
+
+import copy
+import os
+import tempfile
+from unittest import mock
+
+from qiskit.providers.models import PulseBackendConfiguration, QasmBackendConfiguration
+from qiskit.test.mock import FakeOpenPulse2Q
+from qiskit.providers.ibmq.accountprovider import AccountProvider
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.utils import configuration_cache
+from qiskit.providers.ibmq.utils.configuration_cache import BackendConfigurationCache
+
+from ..ibmqtestcase import IBMQTestCase
+from ..http_server import SimpleServer, ETagHandler
+
+RAW_CONFIGURATION = {
+    'backend_name': 'ibmq_fake',
+    'backend_version': '1.0.0',
+    'n_qubits': 2,
+    'basis_gates': ['u1', 'u2', 'u3', 'cx', 'id'],
+    'gates': [{'name': 'u1', 'parameters': ['lambda'], 'qasm_def': 'gate u1(lambda) q { }'}],
+    'local': False,
+    'simulator': False,
+    'conditional': False,
+    'open_pulse': False,
+    'memory': True,
+    'max_shots': 8192,
+    'coupling_map': [[0, 1]]
+}
+
+
+class TestBackendConfigurationCache(IBMQTestCase):
+    """Tests for storing backend configurations on disk."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache_dir.cleanup)
+        self.cache = BackendConfigurationCache(self._cache_dir.name)
+
+    def test_save_load(self):
+        """Test configurations are restored without running their constructor."""
+        configuration = FakeOpenPulse2Q().configuration()
+        self.cache.save('https://url', [configuration], '"etag"', 'digest')
+
+        with mock.patch.object(PulseBackendConfiguration, '__init__',
+                               side_effect=AssertionError('constructor called')):
+            stored = self.cache.load('https://url')
+        restored = stored['configurations'][0]
+        self.assertIsInstance(restored, PulseBackendConfiguration)
+        self.assertEqual(restored.to_dict(), configuration.to_dict())
+        self.assertEqual(restored.dt, configuration.dt)
+        self.assertEqual(restored.gates[0].name, configuration.gates[0].name)
+        self.assertEqual((stored['etag'], stored['digest']), ('"etag"', 'digest'))
+
+        self.assertIsNone(self.cache.load('https://other_url'))
+
+    def test_versions_changed(self):
+        """Test configurations stored by other versions are discarded."""
+        self.cache.save('https://url', [], None, 'digest')
+        with mock.patch.object(configuration_cache, 'provider_version', '0.0.0'):
+            self.assertIsNone(self.cache.load('https://url'))
+
+    def test_corrupted_file(self):
+        """Test corrupted files are discarded."""
+        self.cache.save('https://url', [], None, 'digest')
+        with open(self.cache._path('https://url'), 'wb') as cache_file:
+            cache_file.write(b'not a pickle')
+        self.assertIsNone(self.cache.load('https://url'))
+
+
+class TestProviderConfigurationCache(IBMQTestCase):
+    """Tests for the use of the backend configuration cache by the provider."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Initial class level setup."""
+        super().setUpClass()
+        cls.server = SimpleServer(handler_class=ETagHandler, port=8126, threaded=True)
+        cls.server.start()
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache_dir.cleanup)
+        ETagHandler.valid_data = [RAW_CONFIGURATION]
+        ETagHandler.send_etag = True
+        ETagHandler.status_codes_sent = []
+        self.credentials = Credentials(
+            'dummy_token', self.server.URL, websockets_url='ws://127.0.0.1',
+            configuration_cache={'directory': self._cache_dir.name})
+
+    def _get_provider(self):
+        """Return a new provider, counting the configurations converted."""
+        with mock.patch.object(QasmBackendConfiguration, 'from_dict',
+                               wraps=QasmBackendConfiguration.from_dict) as from_dict:
+            provider = AccountProvider(self.credentials, 'dummy_token')
+        return provider, from_dict.call_count
+
+    def test_not_modified(self):
+        """Test the cached configurations are used if the server reports no change."""
+        provider, converted = self._get_provider()
+        self.assertEqual(converted, 1)
+        provider, converted = self._get_provider()
+        self.assertEqual(converted, 0)
+        self.assertEqual(ETagHandler.status_codes_sent, [200, 304])
+        self.assertEqual(provider.get_backend('ibmq_fake').configuration().n_qubits, 2)
+
+    def test_same_digest(self):
+        """Test the cached configurations are used if the response did not change."""
+        ETagHandler.send_etag = False
+        self._get_provider()
+        provider, converted = self._get_provider()
+        self.assertEqual(converted, 0)
+        self.assertEqual(ETagHandler.status_codes_sent, [200, 200])
+        self.assertEqual(provider.backends()[0].name(), 'ibmq_fake')
+
+    def test_modified(self):
+        """Test the configurations are converted again if they changed."""
+        self._get_provider()
+        new_configuration = copy.deepcopy(RAW_CONFIGURATION)
+        new_configuration['backend_name'] = 'ibmq_new_fake'
+        ETagHandler.valid_data = [RAW_CONFIGURATION, new_configuration]
+        provider, converted = self._get_provider()
+        self.assertEqual(converted, 2)
+        self.assertEqual(len(provider.backends()), 2)
+
+    def test_disabled(self):
+        """Test no configurations are stored if the cache is not enabled."""
+        self.credentials.configuration_cache = None
+        self._get_provider()
+        self._get_provider()
+        self.assertEqual(ETagHandler.status_codes_sent, [200, 200])
+        self.assertEqual(os.listdir(self._cache_dir.name), [])
@@ -29,6 +29,7 @@ from qiskit.providers.ibmq.api.exceptions import (ApiError, UserTimeoutExceededE
                                                   ApiIBMQProtocolError)
 from qiskit.providers.ibmq.exceptions import IBMQBackendError
 from qiskit.providers.jobstatus import JobStatus
+from qiskit.validation.exceptions import ModelValidationError
 from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
 
 from ..jobtestcase import JobTestCase
@@ -304,6 +305,19 @@ class TestIBMQJobStates(JobTestCase):
         self.assertEqual(job.result().success, True)
         self.assertEqual(job.status(), JobStatus.DONE)
 
+    def test_invalid_experiment_result(self):
+        """Test invalid experiment results are only validated when accessed."""
+        job = self.run_with_api(InvalidExperimentResultAPI())
+
+        self.wait_for_initialization(job)
+        self._current_api.progress()
+        result = job.result()
+        self.assertEqual(result.get_counts(0), {'00': 480, '11': 490, '01': 20, '10': 34})
+        with self.assertRaises(ModelValidationError):
+            result.get_counts(1)
+        with self.assertRaises(IBMQJobApiError):
+            job.result(eager=True)
+
     def test_block_on_result_waiting_until_completed(self):
         """Test waiting for job results."""
         from concurrent import futures
@@ -509,6 +523,16 @@ class NonQueuedAPI(BaseFakeAPI):
     ]
 
 
+class InvalidExperimentResultAPI(NonQueuedAPI):
+    """Class for emulating an API returning an invalid experiment result."""
+
+    def job_result(self, job_id, *_args, **_kwargs):
+        """Get job result, with the second experiment missing its shots."""
+        result = copy.deepcopy(super().job_result(job_id, *_args, **_kwargs))
+        del result['results'][1]['shots']
+        return result
+
+
 class ErrorWhileCreatingAPI(BaseFakeAPI):
     """Class emulating an API processing a job that errors while creating the job."""
 
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the incremental JSON decoding utilities."""
+
+import io
+import json
+import pickle
+import time
+from unittest import mock
+
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResult
+from qiskit.providers.ibmq.job.utils import result_from_response, LazyExperimentResults
+from qiskit.providers.ibmq.utils.json_decoder import load_lazy, LazyJSONArray
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestLoadLazy(IBMQTestCase):
+    """Tests for decoding JSON documents lazily."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.result_dict = {
+            'backend_name': 'ibmq_qasm_simulator',
+            'backend_version': '0.1.547',
+            'qobj_id': 'qobj_ü',
+            'job_id': 'job_id',
+            'success': True,
+            'results': [{'shots': 1024,
+                         'success': i != 2,
+                         'status': 'status ü {}'.format(i),
+                         'data': {'counts': {'0x0': 1000 - i, '0x1': 24 + i},
+                                  'memory': ['0x0'] * 100},
+                         'header': {'name': 'circuit_{}'.format(i)}}
+                        for i in range(5)],
+            'status': 'COMPLETED',
+            'time_taken': 1.5e-3
+        }
+
+    def _load(self, document, **kwargs):
+        """Load the document lazily from a file object."""
+        return load_lazy(io.BytesIO(document.encode('utf-8')), **kwargs)
+
+    def test_lazy_array(self):
+        """Test the lazy array elements are decoded on access."""
+        for chunk_size in [1, 7, 64, 1024 * 1024]:
+            for ensure_ascii in [True, False]:
+                with self.subTest(chunk_size=chunk_size, ensure_ascii=ensure_ascii):
+                    document = json.dumps(self.result_dict, indent=1, ensure_ascii=ensure_ascii)
+                    decoded = self._load(document, lazy_keys=['results'], chunk_size=chunk_size)
+                    self.assertIsInstance(decoded['results'], LazyJSONArray)
+                    self.assertEqual(decoded, self.result_dict)
+                    self.assertEqual(decoded['results'][-1], self.result_dict['results'][-1])
+                    self.assertEqual(decoded['results'][1:3], self.result_dict['results'][1:3])
+
+    def test_summaries(self):
+        """Test the summary fields are decoded in advance."""
+        decoded = self._load(json.dumps(self.result_dict, ensure_ascii=False),
+                             lazy_keys=['results'], summary_keys=['success', 'status'],
+                             chunk_size=16)
+        self.assertEqual(decoded['results'].summaries,
+                         [{'success': result['success'], 'status': result['status']}
+                          for result in self.result_dict['results']])
+
+    def test_not_lazy(self):
+        """Test values that are not arrays are decoded eagerly."""
+        for value in [[], None, {'a': [1, 2]}, 123]:
+            with self.subTest(value=value):
+                decoded = self._load(json.dumps({'results': value, 'other': [1]}),
+                                     lazy_keys=['results', 'missing'])
+                if isinstance(value, list):
+                    self.assertIsInstance(decoded['results'], LazyJSONArray)
+                self.assertEqual(decoded, {'results': value, 'other': [1]})
+
+    def test_invalid_document(self):
+        """Test invalid documents raise an error."""
+        for document in ['', '[]', '{"a": 1', '{"results": [1, 2}', '{"a" 1}', '{"a": tru}']:
+            with self.subTest(document=document):
+                with self.assertRaises(ValueError):
+                    self._load(document, lazy_keys=['results'], chunk_size=4)
+
+    def test_pickle(self):
+        """Test lazy arrays are pickled as lists."""
+        decoded = self._load(json.dumps(self.result_dict), lazy_keys=['results'])
+        self.assertEqual(pickle.loads(pickle.dumps(decoded['results'])),
+                         self.result_dict['results'])
+
+
+class TestLazyResult(IBMQTestCase):
+    """Tests for results built from lazily decoded responses."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.result_dict = {
+            'backend_name': 'ibmq_qasm_simulator',
+            'backend_version': '0.1.547',
+            'qobj_id': 'qobj_id',
+            'job_id': 'job_id',
+            'success': True,
+            'results': [{'shots': 1024,
+                         'success': True,
+                         'data': {'counts': {'0x0': 1000 - i, '0x1': 24 + i}},
+                         'header': {'name': 'circuit_{}'.format(i)}}
+                        for i in range(5)]
+        }
+        self.document = io.BytesIO(json.dumps(self.result_dict).encode('utf-8'))
+
+    def test_experiments_converted_on_access(self):
+        """Test only the accessed experiments are converted."""
+        result = result_from_response(load_lazy(self.document, lazy_keys=['results']))
+        self.assertIsInstance(result.results, LazyExperimentResults)
+
+        with mock.patch.object(ExperimentResult, 'from_dict',
+                               wraps=ExperimentResult.from_dict) as from_dict:
+            self.assertEqual(result.get_counts(3), {'0': 997, '1': 27})
+            self.assertEqual(result.get_counts('circuit_1'), {'0': 999, '1': 25})
+            self.assertEqual(result.get_counts(3), {'0': 997, '1': 27})
+            # Looking up by name converts the experiments up to the match.
+            self.assertEqual(from_dict.call_count, 3)
+
+    def test_raw_experiments_converted_on_access(self):
+        """Test experiments already decoded are also converted on access."""
+        result = result_from_response(self.result_dict)
+        self.assertIsInstance(result.results, LazyExperimentResults)
+
+        with mock.patch.object(ExperimentResult, 'from_dict',
+                               wraps=ExperimentResult.from_dict) as from_dict:
+            self.assertEqual(result.get_counts(4), {'0': 996, '1': 28})
+            self.assertEqual(from_dict.call_count, 1)
+
+    def test_time_to_first_count(self):
+        """Benchmark the time to the first counts, lazily and eagerly."""
+        self.result_dict['results'] = [
+            {'shots': 1024, 'success': True, 'meas_level': 2,
+             'data': {'counts': {'0x0': 1000, '0x1': 24}, 'memory': ['0x0', '0x1'] * 512},
+             'header': {'name': 'circuit_{}'.format(i), 'memory_slots': 1}}
+            for i in range(300)]
+
+        start_time = time.time()
+        _ = result_from_response(self.result_dict).get_counts(0)
+        lazy_time = time.time() - start_time
+
+        start_time = time.time()
+        _ = Result.from_dict(self.result_dict).get_counts(0)
+        eager_time = time.time() - start_time
+
+        self.log.info('Time to first counts: %.4fs lazily, %.4fs eagerly.',
+                      lazy_time, eager_time)
+        self.assertLess(lazy_time, eager_time)
+
+    def test_same_result(self):
+        """Test the lazy result matches the eagerly built one."""
+        result = result_from_response(load_lazy(self.document, lazy_keys=['results']))
+        self.assertEqual(result.to_dict(), Result.from_dict(self.result_dict).to_dict())
+        self.assertEqual(result.get_counts(), Result.from_dict(self.result_dict).get_counts())
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the JSON encoding utilities."""
+
+import gzip
+import io
+import json
+
+import numpy as np
+
+from qiskit.providers.ibmq.utils.json_encoder import (IQXJsonEconder, iter_json_chunks,
+                                                      dump_to_spool)
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestJsonEncoder(IBMQTestCase):
+    """Tests for the chunked JSON encoding."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.qobj_dict = {
+            'qobj_id': 'fake',
+            'config': {
+                'shots': 1024,
+                'pulse_library': [{'name': 'pulse{}'.format(i),
+                                   'samples': np.linspace(0, 1, 200) * (1+1j)}
+                                  for i in range(10)],
+                'empty': {}
+            },
+            'experiments': [{'instructions': [{'name': 'u1', 'params': [0.5, 1j]}] * 50,
+                             'header': {'name': 'circuit{}'.format(i), 1: 'non string key'}}
+                            for i in range(20)]
+        }
+
+    def test_same_output(self):
+        """Test the chunked output matches the regular encoder."""
+        expected = json.dumps(self.qobj_dict, cls=IQXJsonEconder).encode('utf-8')
+        self.assertEqual(b''.join(iter_json_chunks(self.qobj_dict, chunk_size=1024)), expected)
+
+    def test_chunk_size(self):
+        """Test the output is split in chunks."""
+        chunks = list(iter_json_chunks(self.qobj_dict, chunk_size=1024))
+        self.assertGreater(len(chunks), 1)
+        # No piece of the test document is larger than 10KB.
+        self.assertLess(max(len(chunk) for chunk in chunks), 1024 + 10 * 1024)
+
+    def test_compressed_output(self):
+        """Test the output can be gzipped."""
+        expected = json.dumps(self.qobj_dict, cls=IQXJsonEconder).encode('utf-8')
+        compressed = b''.join(iter_json_chunks(self.qobj_dict, compress=True, chunk_size=1024))
+        self.assertEqual(gzip.decompress(compressed), expected)
+
+    def test_spool(self):
+        """Test the spool is kept in memory only for small documents."""
+        expected = json.dumps(self.qobj_dict, cls=IQXJsonEconder).encode('utf-8')
+
+        with dump_to_spool(self.qobj_dict) as spool:
+            self.assertIsInstance(spool, io.BytesIO)
+            self.assertEqual(spool.read(), expected)
+
+        with dump_to_spool(self.qobj_dict, max_memory_size=1024) as spool:
+            self.assertNotIsInstance(spool, io.BytesIO)
+            self.assertEqual(spool.read(), expected)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the backend properties cache."""
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+from qiskit.providers.ibmq.utils.properties_cache import BackendPropertiesCache
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+def _properties_dict(last_update_date='2020-04-01T10:00:00Z'):
+    """Return backend properties in the format returned by the API."""
+    return {'backend_name': 'ibmq_fake',
+            'backend_version': '1.0.0',
+            'last_update_date': last_update_date,
+            'qubits': [[{'date': last_update_date, 'name': 'T1', 'unit': 'µs',
+                         'value': 50.0}]],
+            'gates': [{'gate': 'id', 'qubits': [0], 'parameters': [
+                {'date': last_update_date, 'name': 'gate_error', 'unit': '', 'value': 0.001}]}],
+            'general': []}
+
+
+class TestBackendPropertiesCache(IBMQTestCase):
+    """Tests for caching backend properties."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.api = mock.Mock()
+        self.api.backend_properties.return_value = _properties_dict()
+        self.cache = BackendPropertiesCache(self.api)
+
+    def test_cached(self):
+        """Test the latest properties are reused before they expire."""
+        properties = self.cache.properties('ibmq_fake')
+        self.assertEqual(properties.qubits[0][0].value, 50.0)
+        self.assertIs(self.cache.properties('ibmq_fake'), properties)
+        self.assertEqual(self.api.backend_properties.call_count, 1)
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1, 'revalidations': 0})
+
+    def test_revalidated_unchanged(self):
+        """Test expired properties are not converted again if unchanged."""
+        self.cache.ttl = 0
+        properties = self.cache.properties('ibmq_fake')
+        self.assertIs(self.cache.properties('ibmq_fake'), properties)
+        self.assertEqual(self.api.backend_properties.call_count, 2)
+        self.assertEqual(self.cache.stats(), {'hits': 0, 'misses': 1, 'revalidations': 1})
+
+    def test_revalidated_changed(self):
+        """Test expired properties are converted again if updated."""
+        properties = self.cache.properties('ibmq_fake')
+        self.api.backend_properties.return_value = _properties_dict('2020-04-02T10:00:00Z')
+        new_properties = self.cache.properties('ibmq_fake', refresh=True)
+        self.assertIsNot(new_properties, properties)
+        self.assertEqual(new_properties.last_update_date.day, 2)
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_historical(self):
+        """Test properties for a past date are cached."""
+        past_date = datetime.now() - timedelta(days=2)
+        properties = self.cache.properties('ibmq_fake', datetime=past_date)
+        self.assertIs(self.cache.properties('ibmq_fake', datetime=past_date), properties)
+        self.api.backend_properties.assert_called_once_with('ibmq_fake', datetime=past_date)
+
+        # The latest properties are cached separately.
+        self.cache.properties('ibmq_fake')
+        self.assertEqual(self.api.backend_properties.call_count, 2)
+
+    def test_historical_future(self):
+        """Test properties for a future date are not cached."""
+        future_date = datetime.now() + timedelta(days=2)
+        self.cache.properties('ibmq_fake', datetime=future_date)
+        self.cache.properties('ibmq_fake', datetime=future_date)
+        self.assertEqual(self.api.backend_properties.call_count, 2)
+
+    def test_historical_limit(self):
+        """Test the least recently used historical properties are discarded."""
+        self.cache.max_historical = 2
+        dates = [datetime(2020, 1, day) for day in range(1, 4)]
+        for date in dates:
+            self.cache.properties('ibmq_fake', datetime=date)
+        self.cache.properties('ibmq_fake', datetime=dates[2])
+        self.assertEqual(self.api.backend_properties.call_count, 3)
+        self.cache.properties('ibmq_fake', datetime=dates[0])
+        self.assertEqual(self.api.backend_properties.call_count, 4)
+
+    def test_not_available(self):
+        """Test ``None`` is returned when the properties are not available."""
+        self.api.backend_properties.return_value = {}
+        self.assertIsNone(self.cache.properties('ibmq_fake'))
+        self.assertIsNone(self.cache.properties('ibmq_fake', datetime=datetime(2020, 1, 1)))
+
+    def test_shared_by_backends(self):
+        """Test backends sharing a cache share the properties."""
+        backends = [IBMQBackend(mock.Mock(), mock.Mock(), mock.Mock(), api=self.api,
+                                properties_cache=self.cache) for _ in range(2)]
+        for backend in backends:
+            backend.name = mock.Mock(return_value='ibmq_fake')
+        self.assertIs(backends[0].properties(), backends[1].properties())
+        self.assertEqual(self.api.backend_properties.call_count, 1)
@@ -115,6 +115,15 @@ class TestCredentials(IBMQTestCase):
         self.assertEqual(len(credentials), 1)
         self.assertEqual(list(credentials.values())[0].token, 'QCONFIG_TOKEN')
 
+    def test_store_result_cache(self):
+        """Test the result cache configuration is stored, even if empty."""
+        for result_cache in [{}, {'max_size': 1024}]:
+            with self.subTest(result_cache=result_cache), custom_qiskitrc():
+                store_credentials(Credentials('QISKITRC_TOKEN', url=QE2_AUTH_URL,
+                                              result_cache=result_cache))
+                credentials = read_credentials_from_qiskitrc()
+                self.assertEqual(list(credentials.values())[0].result_cache, result_cache)
+
 
 class TestCredentialsKwargs(IBMQTestCase):
     """Test for ``Credentials.connection_parameters()``."""
@@ -171,6 +180,25 @@ class TestCredentialsKwargs(IBMQTestCase):
         result.pop('auth')
         self.assertDictEqual(ntlm_expected_result, result)
 
+    def test_connection_pool_param(self):
+        """Test connection pool settings are passed to the session."""
+        connection_pool = {'pool_maxsize': 32, 'pool_block': True, 'unknown': 1}
+        expected_result = {'verify': True, 'pool_maxsize': 32, 'pool_block': True}
+        pool_credentials = Credentials(
+            'dummy_token', 'https://dummy_url', connection_pool=connection_pool)
+        result = pool_credentials.connection_parameters()
+        self.assertDictEqual(expected_result, result)
+
+    def test_result_cache_param(self):
+        """Test result cache settings are only passed if the cache is enabled."""
+        self.assertIsNone(Credentials('dummy_token', 'https://dummy_url')
+                          .result_cache_parameters())
+        cache_credentials = Credentials(
+            'dummy_token', 'https://dummy_url',
+            result_cache={'directory': '/tmp/results', 'unknown': 1})
+        self.assertDictEqual(cache_credentials.result_cache_parameters(),
+                             {'directory': '/tmp/results'})
+
     def test_malformed_proxy_param(self):
         """Test input with malformed nesting of the proxies dictionary."""
         urls = {'http': 'localhost:8080', 'https': 'localhost:8080'}
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the job result cache."""
+
+import io
+import os
+import tempfile
+
+from qiskit.providers.ibmq.utils.result_cache import ResultCache
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestResultCache(IBMQTestCase):
+    """Tests for storing job results on disk."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache_dir.cleanup)
+        self.cache = ResultCache(self._cache_dir.name)
+
+    def _put(self, job_id, data):
+        """Store ``data`` as the result of ``job_id``."""
+        self.cache.put(job_id, io.BytesIO(data))
+
+    def _get(self, job_id):
+        """Return the stored result of ``job_id``, or ``None``."""
+        result_file = self.cache.get(job_id)
+        if result_file is None:
+            return None
+        with result_file:
+            return result_file.read()
+
+    def _set_last_used(self, job_id, timestamp):
+        """Set the time ``job_id`` was last used."""
+        os.utime(self.cache._path(job_id), (timestamp, timestamp))
+
+    def test_put_get(self):
+        """Test a stored result is returned."""
+        self._put('job_1', b'{"results": []}')
+        self.assertEqual(self._get('job_1'), b'{"results": []}')
+        self.assertIsNone(self._get('job_2'))
+
+    def test_put_rewinds(self):
+        """Test the stored file is positioned at the start afterwards."""
+        result_file = io.BytesIO(b'{}')
+        self.cache.put('job_1', result_file)
+        self.assertEqual(result_file.read(), b'{}')
+
+    def test_invalid_job_id(self):
+        """Test job IDs that are not valid file names are not stored."""
+        self._put('../job_1', b'{}')
+        self.assertIsNone(self._get('../job_1'))
+        self.assertEqual(os.listdir(self._cache_dir.name), [])
+
+    def test_lru_eviction(self):
+        """Test the least recently used results are removed when the cache is full."""
+        data = os.urandom(1000)  # Incompressible.
+        for index in range(3):
+            self._put('job_{}'.format(index), data)
+            self._set_last_used('job_{}'.format(index), 1000 + index)
+        # Reading job_0 makes job_1 the least recently used result.
+        self.assertEqual(self._get('job_0'), data)
+
+        self.cache.max_size = self.cache.size() - 1
+        self._put('job_3', b'{}')
+        self.assertIsNone(self._get('job_1'))
+        for job_id in ['job_0', 'job_2', 'job_3']:
+            self.assertIsNotNone(self._get(job_id))
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+
+    def test_corrupted_file(self):
+        """Test corrupted results are discarded."""
+        self._put('job_1', b'{}')
+        with open(self.cache._path('job_1'), 'wb') as cache_file:
+            cache_file.write(b'not gzip')
+        self.assertIsNone(self._get('job_1'))
+        self.assertFalse(os.path.exists(self.cache._path('job_1')))
+
+    def test_clear(self):
+        """Test all results are removed."""
+        self._put('job_1', b'{}')
+        self.cache.clear()
+        self.assertIsNone(self._get('job_1'))
+        self.assertEqual(self.cache.size(), 0)